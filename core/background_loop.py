@@ -0,0 +1,53 @@
+"""Persistent background event loop for synchronous callers.
+
+Synchronous entry points (e.g. OrchestratorAgent.research_topic_for_aiified) used
+to wrap each coroutine in `asyncio.run`, creating and tearing down an event loop
+per call and discarding any HTTP connection pools bound to it. This module runs a
+single event loop in a daemon thread and dispatches coroutines to it, so loop
+setup is paid once and keep-alive connections survive between calls.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Optional
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its daemon thread on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="background-event-loop", daemon=True
+            )
+            thread.start()
+            _loop = loop
+        return _loop
+
+
+def run_coroutine_sync(coro: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+    """Run a coroutine on the background loop and block until it finishes.
+
+    Args:
+        coro: The coroutine to run.
+        timeout: Optional number of seconds to wait for the result.
+
+    Returns:
+        The coroutine's result; its exception is re-raised in the caller.
+
+    Raises:
+        RuntimeError: If called from the background loop itself, which would deadlock.
+    """
+    loop = get_background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_coroutine_sync() cannot be called from the background loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout)
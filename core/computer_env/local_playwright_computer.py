@@ -66,12 +66,15 @@ class LocalPlaywrightComputer(AsyncComputer):
 
     async def __aexit__(self, exc_type: Optional[type], exc_val: Optional[BaseException], exc_tb: Optional[any]) -> None:
         """Exit context manager: close browser and stop Playwright."""
-        if self._browser_context:
-            await self._browser_context.close()
-        elif self._browser:
-            await self._browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+        try:
+            if self._browser_context:
+                await self._browser_context.close()
+            elif self._browser:
+                await self._browser.close()
+        finally:
+            # Stop the driver even if the browser already crashed and close() failed
+            if self._playwright:
+                await self._playwright.stop()
 
     async def _initialize_browser_and_page(self) -> None:
         """Initialize the browser and page with specified dimensions and default URL."""
@@ -183,6 +186,15 @@ class LocalPlaywrightComputer(AsyncComputer):
         assert self._page is not None, "Page is not initialized"
         return self._page
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the browser and page are still usable (False once Chromium crashed or was closed)."""
+        if self._page is None or self._page.is_closed():
+            return False
+        # A persistent context has no Browser object; its pages close when Chromium goes away
+        browser = self._browser or (self._browser_context.browser if self._browser_context else None)
+        return browser is None or browser.is_connected()
+
     @property
     def environment(self) -> Environment:
         """Return the environment type."""
@@ -196,11 +208,15 @@ class LocalPlaywrightComputer(AsyncComputer):
     async def screenshot(self) -> str:
         """Capture the viewport as a base64-encoded PNG."""
         self.logger.info("SDK called screenshot()")
-        png_bytes = await self.page.screenshot(full_page=False)
-        result = base64.b64encode(png_bytes).decode("utf-8")
-        self.logger.info(f"Screenshot captured: {len(result)} characters")
+        png_bytes = await self.screenshot_bytes()
+        result = base64.b64encode(png_bytes).decode("ascii")
+        self.logger.info("Screenshot captured: %d characters", len(result))
         return result
 
+    async def screenshot_bytes(self) -> bytes:
+        """Capture the viewport as raw PNG bytes, for callers that don't send it to the model."""
+        return await self.page.screenshot(full_page=False)
+
     async def click(self, x: int, y: int, button: Button = "left") -> None:
         """Click at the specified coordinates."""
         self.logger.info(f"SDK called click({x}, {y}, {button})")
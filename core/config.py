@@ -43,6 +43,15 @@ class Settings(BaseSettings):
 
     # Supabase Configuration
     supabase_access_token: str = Field(..., validation_alias="SUPABASE_ACCESS_TOKEN")
+    # Optional direct Postgres DSN; when set (and asyncpg is installed) action logs bypass MCP
+    supabase_postgres_dsn: Optional[str] = Field(None, validation_alias="SUPABASE_POSTGRES_DSN")
+
+    # Max concurrent per-item operations (mentions, approved replies) in orchestrator workflows
+    orchestrator_concurrency: int = Field(4, validation_alias="ORCHESTRATOR_CONCURRENCY")
+    # Max concurrent recent-interaction checks against the memory backend
+    memory_check_concurrency: int = Field(32, validation_alias="MEMORY_CHECK_CONCURRENCY")
+    # Seconds a "skip" verdict from a recent-interaction check is reused before re-querying
+    memory_check_cache_ttl_seconds: float = Field(30, validation_alias="MEMORY_CHECK_CACHE_TTL_SECONDS")
 
     log_level: str = Field("INFO", validation_alias="LOG_LEVEL")
     sqlite_db_path: str = Field("data/agent_data.db", validation_alias="SQLITE_DB_PATH")
@@ -305,14 +305,13 @@ X_BASE_URL = "https://x.com"
 # Regular expression pattern for extracting tweet IDs from URLs
 TWEET_URL_PATTERN = r'/status/(\d+)'
 
+# Keep-alive connections kept per host by the X API HTTP session
+X_API_HTTP_POOL_SIZE = 10
+
 # =============================================================================
 # Text Processing Constants
 # =============================================================================
 
-# String parsing constants
-TEXT_PARSING_START_MARKER = "text='"
-TEXT_PARSING_QUOTE_OFFSET = 6
-
 # Image data URL constants
 IMAGE_DATA_URL_PREFIX = "data:image/png;base64"
 
@@ -325,6 +324,34 @@ PAGE_RELOAD_WAIT_SECONDS = 3
 # Default tweet counts
 DEFAULT_TIMELINE_TWEET_COUNT = 3
 
+# Mentions polling backoff (seconds) - grows after each empty fetch, resets on new mentions
+MENTIONS_POLL_BACKOFF_INITIAL_SECONDS = 30
+MENTIONS_POLL_BACKOFF_MAX_SECONDS = 900
+
+# How long the last processed mention ID read from the state store is trusted (other writers may change it)
+LAST_MENTION_ID_CACHE_TTL_SECONDS = 300
+
+# Content idea dedup - max idea keys remembered by the process to skip repeat inserts
+CONTENT_IDEA_DEDUP_CAPACITY = 10_000
+
+# Background action logging - queued entries beyond the max are dropped; batch = rows per INSERT
+ACTION_LOG_QUEUE_MAXSIZE = 20_000
+ACTION_LOG_BATCH_SIZE = 64
+
+# Direct Postgres action logs - connect timeout, and how long to use MCP after a failed connect
+PG_POOL_CONNECT_TIMEOUT_SECONDS = 10
+PG_POOL_RETRY_DELAY_SECONDS = 300
+
+# Memo cache for recent-target interaction checks (TTL: settings.memory_check_cache_ttl_seconds)
+MEMORY_CHECK_CACHE_MAX_ENTRIES = 128
+
+# Memo cache for read-only LLM tool results (recent actions, unused ideas, research)
+TOOL_RESULT_CACHE_TTL_SECONDS = 60
+TOOL_RESULT_CACHE_MAX_ENTRIES = 32
+
+# Memoized CUA prompt builders (prompts are pure functions of their inputs)
+CUA_PROMPT_CACHE_MAX_ENTRIES = 256
+
 # =============================================================================
 # Logging Constants  
 # =============================================================================
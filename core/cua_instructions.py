@@ -16,8 +16,15 @@ Template functions generate task-specific prompts for common CUA workflows:
 - Timeline reading
 
 These templates help ensure consistent CUA behavior across different use cases.
+The most frequently requested prompt builders are memoized, since they are pure
+functions of their arguments.
 """
 
+import functools
+import re
+
+from core.constants import CUA_PROMPT_CACHE_MAX_ENTRIES
+
 # =============================================================================
 # CUA System Instructions Template
 # =============================================================================
@@ -342,6 +349,7 @@ RESPONSE FORMATS:
 - 'FAILED: Could not send reply' (if both keyboard shortcut and button fail)
 - 'SESSION_INVALIDATED' (if you encounter login screen)"""
 
+@functools.lru_cache(maxsize=CUA_PROMPT_CACHE_MAX_ENTRIES)
 def get_tweet_like_prompt(tweet_url: str) -> str:
     """Generate CUA prompt for liking a tweet."""
     return f"""You are controlling a browser on X.com and you are already on the specific tweet page: {tweet_url}
@@ -512,6 +520,7 @@ IMPORTANT NOTES:
 - Take screenshots between major steps to track progress
 - If search returns no results, respond with 'FAILED: No search results found for query'"""
 
+@functools.lru_cache(maxsize=CUA_PROMPT_CACHE_MAX_ENTRIES)
 def get_timeline_reading_prompt(num_tweets: int) -> str:
     """Generate CUA prompt for reading timeline tweets."""
     return f"""Your task is to read the text content of the top {num_tweets} tweets from your home timeline. You are already logged in and the viewport has been pre-stabilized.
@@ -650,6 +659,7 @@ RESPONSE FORMATS:
 
 This consolidated approach provides maximum reliability by combining viewport stabilization with individual page navigation for the most robust content extraction possible."""
 
+@functools.lru_cache(maxsize=CUA_PROMPT_CACHE_MAX_ENTRIES)
 def get_search_and_like_tweet_prompt(search_query: str, max_iterations: int = 20) -> str:
     """Generate comprehensive CUA prompt for searching and liking tweets.
     
@@ -832,6 +842,19 @@ EXECUTION GUIDELINES:
 - Be adaptive: Use fallback actions if primary methods fail
 - Be clear: Provide specific details in your final response"""
 
+# Task-description patterns used by create_smart_cua_task_prompt, compiled once at import
+_SEARCH_AND_LIKE_PHRASES = ("find a tweet", "search for", "look for a tweet", "find and like")
+_ENGAGE_PHRASES = ("like", "heart", "engage")
+_TWEET_URL_INDICATORS = ("http", "x.com", "twitter.com", "tweet")
+_TIMELINE_PHRASES = ("read timeline", "browse timeline", "check timeline", "timeline tweets")
+_POST_TWEET_PHRASES = ("post tweet", "create tweet", "publish tweet", "send tweet")
+_SEARCH_PHRASES = ("search for", "find tweets about", "search x", "look up")
+_HASHTAG_RE = re.compile(r'#\w+')
+_ABOUT_RE = re.compile(r'about [\'"]?([^\'"\.\,]+)', re.IGNORECASE)
+_URL_RE = re.compile(r'https?://[^\s]+')
+_NUM_TWEETS_RE = re.compile(r'(\d+)\s*tweets?')
+
+
 def create_smart_cua_task_prompt(task_description: str, context: dict = None) -> tuple:
     """Intelligently generate a CUA prompt and determine optimal parameters based on task description.
     
@@ -851,21 +874,20 @@ def create_smart_cua_task_prompt(task_description: str, context: dict = None) ->
     task_lower = task_description.lower()
     
     # Search and like pattern detection
-    if any(phrase in task_lower for phrase in [
-        "find a tweet", "search for", "look for a tweet", "find and like"
-    ]) and any(phrase in task_lower for phrase in ["like", "heart", "engage"]):
+    if any(phrase in task_lower for phrase in _SEARCH_AND_LIKE_PHRASES) and any(
+        phrase in task_lower for phrase in _ENGAGE_PHRASES
+    ):
         
         # Extract search query from the description
         search_query = "OpenAI"  # Default fallback
         
         # Try to extract specific hashtags or search terms
-        import re
-        hashtag_match = re.search(r'#\w+', task_description)
+        hashtag_match = _HASHTAG_RE.search(task_description)
         if hashtag_match:
             search_query = hashtag_match.group()
         elif 'about' in task_lower:
             # Extract text after "about"
-            about_match = re.search(r'about [\'"]?([^\'"\.\,]+)', task_description, re.IGNORECASE)
+            about_match = _ABOUT_RE.search(task_description)
             if about_match:
                 search_query = about_match.group(1).strip()
         
@@ -873,14 +895,13 @@ def create_smart_cua_task_prompt(task_description: str, context: dict = None) ->
         return prompt, "https://x.com", 30
     
     # Direct tweet liking (when URL is provided)
-    elif "like" in task_lower and any(url_indicator in task_lower for url_indicator in [
-        "http", "x.com", "twitter.com", "tweet"
-    ]):
+    elif "like" in task_lower and any(
+        url_indicator in task_lower for url_indicator in _TWEET_URL_INDICATORS
+    ):
         # Try to extract URL from context or description
         tweet_url = context.get('tweet_url', 'https://x.com')
         if 'http' in task_description:
-            import re
-            url_match = re.search(r'https?://[^\s]+', task_description)
+            url_match = _URL_RE.search(task_description)
             if url_match:
                 tweet_url = url_match.group()
         
@@ -888,13 +909,10 @@ def create_smart_cua_task_prompt(task_description: str, context: dict = None) ->
         return prompt, tweet_url, 20
     
     # Timeline reading
-    elif any(phrase in task_lower for phrase in [
-        "read timeline", "browse timeline", "check timeline", "timeline tweets"
-    ]):
+    elif any(phrase in task_lower for phrase in _TIMELINE_PHRASES):
         num_tweets = 5  # Default
         # Try to extract number
-        import re
-        num_match = re.search(r'(\d+)\s*tweets?', task_description)
+        num_match = _NUM_TWEETS_RE.search(task_description)
         if num_match:
             num_tweets = int(num_match.group(1))
         
@@ -902,17 +920,13 @@ def create_smart_cua_task_prompt(task_description: str, context: dict = None) ->
         return prompt, "https://x.com", 25
     
     # Tweet posting
-    elif any(phrase in task_lower for phrase in [
-        "post tweet", "create tweet", "publish tweet", "send tweet"
-    ]):
+    elif any(phrase in task_lower for phrase in _POST_TWEET_PHRASES):
         tweet_text = context.get('tweet_text', 'Hello from AI agent!')
         prompt = get_tweet_posting_prompt(tweet_text)
         return prompt, "https://x.com", 15
     
     # Search functionality
-    elif any(phrase in task_lower for phrase in [
-        "search for", "find tweets about", "search x", "look up"
-    ]):
+    elif any(phrase in task_lower for phrase in _SEARCH_PHRASES):
         query = context.get('search_query', 'AI')
         num_results = context.get('num_results', 5)
         prompt = get_search_x_prompt(query, num_results)
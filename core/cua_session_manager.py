@@ -14,7 +14,8 @@ from typing import Optional
 
 from core.computer_env.local_playwright_computer import LocalPlaywrightComputer
 from core.cua_workflow import CuaWorkflowRunner
-from core.models import CuaTask
+from core.constants import FAILED_PREFIX
+from core.models import CuaResult, CuaTask
 from core.config import settings
 
 
@@ -29,6 +30,8 @@ class CuaSessionManager:
         async with CuaSessionManager() as session:
             result1 = await session.run_task(task1)
             result2 = await session.run_task(task2)
+            if result2.success:
+                print(result2.output)
             # Browser stays open between tasks
     """
     
@@ -102,14 +105,14 @@ class CuaSessionManager:
         else:
             self.logger.info("ℹ️ No active CUA session to stop")
     
-    async def run_task(self, task: CuaTask) -> str:
+    async def run_task(self, task: CuaTask) -> CuaResult:
         """Execute a CUA task within the persistent session.
         
         Args:
             task: The CuaTask object containing prompt, start_url, and configuration
             
         Returns:
-            String describing the outcome of the CUA operation
+            CuaResult with the CUA's output text and whether it reported success
             
         Raises:
             Exception: If session is not started or task execution fails
@@ -117,29 +120,29 @@ class CuaSessionManager:
         if not self._session_started or not self.computer:
             raise Exception("CUA session not started. Use async context manager.")
         
-        self.logger.info(f"📋 Executing CUA task in persistent session: {task.prompt[:100]}...")
+        self.logger.info("📋 Executing CUA task in persistent session: %.100s...", task.prompt)
         
         try:
             # Use the stateless workflow runner with our persistent computer session
             runner = CuaWorkflowRunner()
             result = await runner.run_workflow(task, self.computer)
             
-            self.logger.info(f"✅ CUA task completed: {result[:200]}...")
+            self.logger.info("✅ CUA task completed: %.200s...", result.output)
             return result
             
         except Exception as e:
             error_msg = f"CUA task execution failed in persistent session: {e}"
             self.logger.error(error_msg, exc_info=True)
-            return f"FAILED: {error_msg}"
+            return CuaResult(success=False, output=f"{FAILED_PREFIX}: {error_msg}")
     
     @property
     def is_active(self) -> bool:
         """Check if the CUA session is currently active.
         
         Returns:
-            True if session is started and computer is available
+            True if session is started and its browser is still connected
         """
-        return self._session_started and self.computer is not None
+        return self._session_started and self.computer is not None and self.computer.is_connected
     
     async def get_session_info(self) -> dict:
         """Get information about the current session state.
@@ -2,7 +2,12 @@
 
 import asyncio
 import logging
-from typing import Optional
+import re
+import weakref
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+from openai import AsyncOpenAI
 
 from core.computer_env.local_playwright_computer import LocalPlaywrightComputer
 from core.config import settings
@@ -44,10 +49,108 @@ from core.constants import (
     COMPLETED_STRING_LITERAL,
     RESPONSE_TEXT_SLICE_SHORT,
     RESPONSE_TEXT_SLICE_MEDIUM,
-    TEXT_PARSING_START_MARKER,
-    TEXT_PARSING_QUOTE_OFFSET,
 )
-from core.models import CuaTask
+from core.models import CuaResult, CuaTask
+
+
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """Return the AsyncOpenAI client shared by CUA workflows on the running event loop.
+
+    One client keeps its HTTP connection pool warm across tasks, so only the
+    first workflow pays the TCP/TLS handshake to the responses API. Its
+    connections are bound to the loop that opened them, hence one per loop.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = AsyncOpenAI(api_key=settings.openai_api_key)
+        _async_clients[loop] = client
+    return client
+
+
+# Request parts shared by every responses.create call (never mutated)
+_CUA_TOOLS = [CUA_TOOL_CONFIG]
+_CUA_SYSTEM_MESSAGE = {"role": API_ROLE_SYSTEM, "content": CUA_SYSTEM_INSTRUCTIONS}
+_IMAGE_URL_PREFIX = IMAGE_DATA_URL_PREFIX + ","
+
+# Terminal markers the CUA is prompted to report, in priority order
+_TERMINAL_MARKERS = (SUCCESS_STRING_LITERAL, SESSION_INVALIDATED_STRING_LITERAL, FAILED_STRING_LITERAL)
+_TERMINAL_MARKER_RE = re.compile("|".join(map(re.escape, _TERMINAL_MARKERS)))
+
+# Last-resort match of the first `text='...'` / `text="..."` field in a message repr
+_REPR_TEXT_RE = re.compile(r"""text=(?:'((?:[^'\\]|\\.)*)'|"((?:[^"\\]|\\.)*)")""")
+
+
+def _terminal_marker(text: str) -> Optional[str]:
+    """Return the highest-priority terminal marker found in text, or None.
+
+    One regex pass collects every marker, so SUCCESS still wins over FAILED
+    wherever each appears.
+    """
+    found = set(_TERMINAL_MARKER_RE.findall(text))
+    for marker in _TERMINAL_MARKERS:
+        if marker in found:
+            return marker
+    return None
+
+
+def _reported_success(text: str, marker: Optional[str]) -> bool:
+    """Whether a final CUA output reports success.
+
+    A SUCCESS marker counts unless the output leads with FAILED (e.g. a failure
+    report quoting the SUCCESS message it was asked for).
+    """
+    return marker == SUCCESS_STRING_LITERAL and not text.startswith(FAILED_PREFIX)
+
+
+def _unsuccessful(output: str) -> CuaResult:
+    """A workflow result that did not report success (failure, invalid session or no marker)."""
+    return CuaResult(success=False, output=output)
+
+
+def _message_text(msg: Any) -> str:
+    """Return the text of a response message item, or "" if it has none."""
+    text = getattr(msg, 'text', None)
+    if text is not None:
+        return text
+    content = getattr(msg, 'content', None)
+    text = getattr(content, 'text', None)
+    if text is not None:
+        return text
+    if isinstance(content, list):
+        for part in content:
+            text = getattr(part, 'text', None)
+            if text:
+                return text
+    match = _REPR_TEXT_RE.search(str(msg))
+    if match:
+        return match.group(1) if match.group(1) is not None else match.group(2)
+    return ""
+
+
+def _group_output_by_type(output: Iterable[Any]) -> "defaultdict[str, list]":
+    """Bin response output items by their `type` in one pass; untyped items are dropped."""
+    items_by_type: "defaultdict[str, list]" = defaultdict(list)
+    for item in output:
+        item_type = getattr(item, 'type', None)
+        if item_type is not None:
+            items_by_type[item_type].append(item)
+    return items_by_type
+
+
+async def _screenshot_size(computer: LocalPlaywrightComputer) -> int:
+    """Return the base64 length of a fresh screenshot without encoding it.
+
+    Size checks compare against thresholds in base64 characters, which is what
+    `computer.screenshot()` returns; probes that are only measured skip the encoding.
+    """
+    png_bytes = await computer.screenshot_bytes()
+    return 4 * ((len(png_bytes) + 2) // 3)
 
 
 class CuaWorkflowRunner:
@@ -61,7 +164,63 @@ class CuaWorkflowRunner:
         """Initialize the CUA workflow runner."""
         self.logger = logging.getLogger(__name__)
     
-    async def run_workflow(self, task: CuaTask, computer: LocalPlaywrightComputer) -> str:
+    def _final_result(self, items_by_type: "defaultdict[str, list]") -> CuaResult:
+        """Turn a response without computer calls into the workflow's result.
+        
+        Text, then message, then reasoning output is checked for the terminal
+        marker the CUA was asked to report; success comes from that marker.
+        """
+        text_outputs = items_by_type[RESPONSE_TYPE_TEXT]
+        reasoning_outputs = items_by_type[RESPONSE_TYPE_REASONING]
+        message_outputs = items_by_type[RESPONSE_TYPE_MESSAGE]
+        
+        if text_outputs:
+            final_text = getattr(text_outputs[-1], 'text', None)
+            if final_text is None:
+                final_text = str(text_outputs[-1])
+            self.logger.info("CUA completed with text output: %s", final_text)
+            marker = _terminal_marker(final_text)
+            if marker:
+                return CuaResult(success=_reported_success(final_text, marker), output=final_text)
+        
+        if message_outputs:
+            # Handle both direct text and ResponseOutputText objects
+            final_message = ""
+            for msg in message_outputs:
+                final_message = _message_text(msg)
+                if final_message:
+                    break
+            
+            self.logger.info("CUA completed with message text: %s", final_message)
+            # Check if message contains our response patterns
+            marker = _terminal_marker(final_message)
+            if marker == SUCCESS_STRING_LITERAL:
+                # Return the actual success message
+                return CuaResult(success=_reported_success(final_message, marker), output=final_message)
+            elif marker == SESSION_INVALIDATED_STRING_LITERAL:
+                return _unsuccessful(SESSION_INVALIDATED)
+            elif marker == FAILED_STRING_LITERAL:
+                return _unsuccessful(f"{FAILED_PREFIX}: {final_message}")
+        
+        if reasoning_outputs:
+            final_reasoning = str(getattr(reasoning_outputs[-1], 'content', reasoning_outputs[-1]))
+            self.logger.info("CUA completed with reasoning: %.*s...", LOG_TEXT_EXTENDED, final_reasoning)
+            # Check if reasoning contains our response patterns
+            marker = _terminal_marker(final_reasoning)
+            if marker == SUCCESS_STRING_LITERAL:
+                return CuaResult(
+                    success=_reported_success(final_reasoning, marker),
+                    output=f"{SUCCESS_PREFIX}: Task completed successfully (from reasoning)",
+                )
+            elif marker == SESSION_INVALIDATED_STRING_LITERAL:
+                return _unsuccessful(SESSION_INVALIDATED)
+            elif marker == FAILED_STRING_LITERAL:
+                return _unsuccessful(f"{FAILED_PREFIX}: {final_reasoning[:RESPONSE_TEXT_SLICE_SHORT]}")
+        
+        self.logger.info("No computer call found, CUA workflow completed")
+        return _unsuccessful(COMPLETED_CUA_WORKFLOW)
+    
+    async def run_workflow(self, task: CuaTask, computer: LocalPlaywrightComputer) -> CuaResult:
         """Execute a CUA workflow based on the provided task using an existing computer session.
         
         Args:
@@ -69,11 +228,11 @@ class CuaWorkflowRunner:
             computer: Pre-initialized LocalPlaywrightComputer instance to use for the workflow
             
         Returns:
-            String describing the outcome of the CUA operation
+            CuaResult with the CUA's final output and whether it reported success
         """
-        self.logger.info(f"Starting CUA workflow with prompt: {task.prompt[:LOG_TEXT_MEDIUM]}...")
+        self.logger.info("Starting CUA workflow with prompt: %.*s...", LOG_TEXT_MEDIUM, task.prompt)
         if task.start_url:
-            self.logger.info(f"Starting URL: {task.start_url}")
+            self.logger.info("Starting URL: %s", task.start_url)
         
         try:
             # =================================================================
@@ -124,20 +283,18 @@ class CuaWorkflowRunner:
                 self.logger.info("✅ Layer 1: Pre-viewport stabilization completed successfully")
                 
             except Exception as stabilization_error:
-                self.logger.warning(f"⚠️ Pre-viewport stabilization failed (proceeding anyway): {stabilization_error}")
+                self.logger.warning("⚠️ Pre-viewport stabilization failed (proceeding anyway): %s", stabilization_error)
             
             # =================================================================
             # End of Layer 1 Pre-Viewport Stabilization
             # =================================================================
             
-            # Initialize the OpenAI client for direct responses API calls
-            from openai import OpenAI
-            import base64
-            client = OpenAI(api_key=settings.openai_api_key)
+            # Bound create method of the shared OpenAI client, resolved once per workflow
+            create_response = get_async_openai_client().responses.create
             
             # Navigate to start URL if provided (after stabilization)
             if task.start_url:
-                self.logger.info(f"🧭 Navigating to start URL: {task.start_url}")
+                self.logger.info("🧭 Navigating to start URL: %s", task.start_url)
                 try:
                     await computer.page.goto(task.start_url, wait_until='networkidle', timeout=PAGE_NAVIGATION_TIMEOUT)
                     await computer.page.wait_for_timeout(PAGE_STABILIZATION_DELAY)
@@ -160,23 +317,20 @@ class CuaWorkflowRunner:
                     """)
                     await asyncio.sleep(UI_RESPONSE_DELAY / 1000)
                     
-                    self.logger.info(f"✅ Successfully navigated to {task.start_url} with viewport stabilization")
+                    self.logger.info("✅ Successfully navigated to %s with viewport stabilization", task.start_url)
                 except Exception as nav_error:
-                    self.logger.error(f"❌ Failed to navigate to {task.start_url}: {nav_error}")
-                    return f"{FAILED_PREFIX}: Could not navigate to start URL - {nav_error}"
-            
-            # Define system instructions (general CUA behavior)
-            system_instructions = CUA_SYSTEM_INSTRUCTIONS
+                    self.logger.error("❌ Failed to navigate to %s: %s", task.start_url, nav_error)
+                    return _unsuccessful(f"{FAILED_PREFIX}: Could not navigate to start URL - {nav_error}")
             
-            # Initial request to get first screenshot
+            # Initial request to get first screenshot (system instructions = general CUA behavior)
             self.logger.info("Sending initial CUA request")
             initial_input_messages = [
-                {"role": API_ROLE_SYSTEM, "content": system_instructions},
+                _CUA_SYSTEM_MESSAGE,
                 {"role": API_ROLE_USER, "content": task.prompt}
             ]
-            response = client.responses.create(
+            response = await create_response(
                 model=COMPUTER_USE_MODEL,
-                tools=[CUA_TOOL_CONFIG],
+                tools=_CUA_TOOLS,
                 input=initial_input_messages,
                 truncation=API_TRUNCATION_AUTO
             )
@@ -184,82 +338,32 @@ class CuaWorkflowRunner:
             max_iterations = task.max_iterations
             iteration = 0
             consecutive_empty_screenshots = 0
+            # Per-item output dumps are debug-only; check once instead of per item
+            log_output_items = self.logger.isEnabledFor(logging.DEBUG)
             
             while iteration < max_iterations:
                 iteration += 1
-                self.logger.info(f"CUA iteration {iteration}")
+                self.logger.info("CUA iteration %d", iteration)
                 
                 # Check for computer calls in the response
-                computer_calls = [item for item in response.output if hasattr(item, 'type') and item.type == RESPONSE_TYPE_COMPUTER_CALL]
+                items_by_type = _group_output_by_type(response.output)
+                computer_calls = items_by_type[RESPONSE_TYPE_COMPUTER_CALL]
                 
                 # Debug: Log all response output items
-                self.logger.info(f"Response output items: {len(response.output)}")
-                for i, item in enumerate(response.output):
-                    if hasattr(item, 'type'):
-                        self.logger.info(f"  Item {i}: type={item.type}")
-                        if item.type == RESPONSE_TYPE_TEXT and hasattr(item, 'text'):
-                            self.logger.info(f"    Text content: {item.text[:LOG_TEXT_LONG]}...")
-                    else:
-                        self.logger.info(f"  Item {i}: {type(item)} - {str(item)[:LOG_TEXT_MEDIUM]}...")
+                if log_output_items:
+                    self.logger.debug("Response output items: %d", len(response.output))
+                    for i, item in enumerate(response.output):
+                        item_type = getattr(item, 'type', None)
+                        if item_type is not None:
+                            self.logger.debug("  Item %d: type=%s", i, item_type)
+                            item_text = getattr(item, 'text', None) if item_type == RESPONSE_TYPE_TEXT else None
+                            if item_text is not None:
+                                self.logger.debug("    Text content: %.*s...", LOG_TEXT_LONG, item_text)
+                        else:
+                            self.logger.debug("  Item %d: %s - %.*s...", i, type(item), LOG_TEXT_MEDIUM, item)
                 
                 if not computer_calls:
-                    # Check for text output that might contain our success/failure message
-                    text_outputs = [item for item in response.output if hasattr(item, 'type') and item.type == RESPONSE_TYPE_TEXT]
-                    reasoning_outputs = [item for item in response.output if hasattr(item, 'type') and item.type == RESPONSE_TYPE_REASONING]
-                    message_outputs = [item for item in response.output if hasattr(item, 'type') and item.type == RESPONSE_TYPE_MESSAGE]
-                    
-                    if text_outputs:
-                        final_text = text_outputs[-1].text if hasattr(text_outputs[-1], 'text') else str(text_outputs[-1])
-                        self.logger.info(f"CUA completed with text output: {final_text}")
-                        if SUCCESS_PREFIX in final_text:
-                            return final_text
-                        elif SESSION_INVALIDATED in final_text:
-                            return final_text
-                        elif FAILED_PREFIX in final_text:
-                            return final_text
-                    
-                    if message_outputs:
-                        # Handle both direct text and ResponseOutputText objects
-                        final_message = ""
-                        for msg in message_outputs:
-                            if hasattr(msg, 'text'):
-                                final_message = msg.text
-                                break
-                            elif hasattr(msg, 'content') and hasattr(msg.content, 'text'):
-                                final_message = msg.content.text
-                                break
-                            elif str(msg):
-                                msg_str = str(msg)
-                                # Extract text from ResponseOutputText representation
-                                if TEXT_PARSING_START_MARKER in msg_str:
-                                    start = msg_str.find(TEXT_PARSING_START_MARKER) + TEXT_PARSING_QUOTE_OFFSET
-                                    end = msg_str.find("'", start)
-                                    if end > start:
-                                        final_message = msg_str[start:end]
-                                        break
-                        
-                        self.logger.info(f"CUA completed with message text: {final_message}")
-                        # Check if message contains our response patterns
-                        if SUCCESS_STRING_LITERAL in final_message:
-                            return final_message  # Return the actual success message
-                        elif SESSION_INVALIDATED_STRING_LITERAL in final_message:
-                            return SESSION_INVALIDATED
-                        elif FAILED_STRING_LITERAL in final_message:
-                            return f"{FAILED_PREFIX}: {final_message}"
-                    
-                    if reasoning_outputs:
-                        final_reasoning = reasoning_outputs[-1].content if hasattr(reasoning_outputs[-1], 'content') else str(reasoning_outputs[-1])
-                        self.logger.info(f"CUA completed with reasoning: {final_reasoning[:LOG_TEXT_EXTENDED]}...")
-                        # Check if reasoning contains our response patterns
-                        if SUCCESS_STRING_LITERAL in final_reasoning:
-                            return f"{SUCCESS_PREFIX}: Task completed successfully (from reasoning)"
-                        elif SESSION_INVALIDATED_STRING_LITERAL in final_reasoning:
-                            return SESSION_INVALIDATED
-                        elif FAILED_STRING_LITERAL in final_reasoning:
-                            return f"{FAILED_PREFIX}: {final_reasoning[:RESPONSE_TEXT_SLICE_SHORT]}"
-                    
-                    self.logger.info("No computer call found, CUA workflow completed")
-                    return COMPLETED_CUA_WORKFLOW
+                    return self._final_result(items_by_type)
                 
                 computer_call = computer_calls[0]
                 action = computer_call.action
@@ -267,11 +371,12 @@ class CuaWorkflowRunner:
                 
                 # Handle safety checks - automatically acknowledge routine social media checks
                 acknowledged_checks = []
-                if hasattr(computer_call, 'pending_safety_checks') and computer_call.pending_safety_checks:
-                    self.logger.info(f"Safety checks detected: {len(computer_call.pending_safety_checks)} checks")
+                pending_safety_checks = getattr(computer_call, 'pending_safety_checks', None)
+                if pending_safety_checks:
+                    self.logger.info("Safety checks detected: %s checks", len(pending_safety_checks))
                     # Automatically acknowledge routine social media safety checks for autonomous operation
-                    for check in computer_call.pending_safety_checks:
-                        self.logger.info(f"Acknowledging safety check: {check.code} - {check.message}")
+                    for check in pending_safety_checks:
+                        self.logger.info("Acknowledging safety check: %s - %s", check.code, check.message)
                         acknowledged_checks.append({
                             "id": check.id,
                             "code": check.code,
@@ -282,8 +387,8 @@ class CuaWorkflowRunner:
                 try:
                     await self._execute_computer_action(computer, action)
                 except Exception as e:
-                    self.logger.error(f"Error executing computer action {action.type}: {e}")
-                    return f"{FAILED_PREFIX}: Computer action execution error: {e}"
+                    self.logger.error("Error executing computer action %s: %s", action.type, e)
+                    return _unsuccessful(f"{FAILED_PREFIX}: Computer action execution error: {e}")
                 
                 # Take screenshot with enhanced monitoring
                 try:
@@ -291,12 +396,12 @@ class CuaWorkflowRunner:
                     screenshot_size = len(screenshot_b64)
                     
                     # Monitor for blank/problematic screenshots
-                    self.logger.info(f"Screenshot size: {screenshot_size} characters")
+                    self.logger.info("Screenshot size: %s characters", screenshot_size)
                     
                     # Check for consistently small screenshots (blank page indicator)
                     if screenshot_size < SCREENSHOT_MIN_SIZE_THRESHOLD:
                         consecutive_empty_screenshots += 1
-                        self.logger.warning(f"Small screenshot detected ({screenshot_size} chars). Count: {consecutive_empty_screenshots}")
+                        self.logger.warning("Small screenshot detected (%s chars). Count: %s", screenshot_size, consecutive_empty_screenshots)
                         
                         # If we get multiple small screenshots, the page is likely in a bad state
                         if consecutive_empty_screenshots >= CONSECUTIVE_EMPTY_SCREENSHOT_LIMIT:
@@ -311,7 +416,7 @@ class CuaWorkflowRunner:
                                 # Take a new screenshot to check if recovery worked
                                 recovery_screenshot = await computer.screenshot()
                                 recovery_size = len(recovery_screenshot)
-                                self.logger.info(f"Recovery screenshot size: {recovery_size} characters")
+                                self.logger.info("Recovery screenshot size: %s characters", recovery_size)
                                 
                                 if recovery_size > SCREENSHOT_MIN_SIZE_THRESHOLD:
                                     self.logger.info("Page refresh recovery successful")
@@ -319,52 +424,55 @@ class CuaWorkflowRunner:
                                     consecutive_empty_screenshots = 0
                                 else:
                                     self.logger.error("Page refresh recovery failed - still getting small screenshots")
-                                    return f"{FAILED_PREFIX}: Page appears blank and recovery attempts failed"
+                                    return _unsuccessful(f"{FAILED_PREFIX}: Page appears blank and recovery attempts failed")
                             except Exception as recovery_error:
-                                self.logger.error(f"Recovery attempt failed: {recovery_error}")
-                                return f"{FAILED_PREFIX}: Page refresh recovery failed"
+                                self.logger.error("Recovery attempt failed: %s", recovery_error)
+                                return _unsuccessful(f"{FAILED_PREFIX}: Page refresh recovery failed")
                     else:
                         consecutive_empty_screenshots = 0  # Reset counter on good screenshot
                     
                 except Exception as e:
-                    self.logger.error(f"Error taking screenshot: {e}")
-                    return f"{FAILED_PREFIX}: Screenshot capture error: {e}"
+                    self.logger.error("Error taking screenshot: %s", e)
+                    return _unsuccessful(f"{FAILED_PREFIX}: Screenshot capture error: {e}")
                 
-                # Prepare next request input
+                # Prepare next request input; drop the bare base64 string once it is
+                # embedded so only one multi-MB copy stays alive during the request
+                image_url = _IMAGE_URL_PREFIX + screenshot_b64
+                del screenshot_b64
                 input_content = [{
                     "call_id": call_id,
                     "type": CONTENT_TYPE_COMPUTER_CALL_OUTPUT,
                     "output": {
                         "type": CONTENT_TYPE_INPUT_IMAGE,
-                        "image_url": f"{IMAGE_DATA_URL_PREFIX},{screenshot_b64}"
+                        "image_url": image_url
                     }
                 }]
                 
                 # Add acknowledged safety checks if any
                 if acknowledged_checks:
                     input_content[0]["acknowledged_safety_checks"] = acknowledged_checks
-                    self.logger.info(f"Including {len(acknowledged_checks)} acknowledged safety checks in next request")
+                    self.logger.info("Including %s acknowledged safety checks in next request", len(acknowledged_checks))
                 
                 # Send next request
                 try:
-                    response = client.responses.create(
+                    response = await create_response(
                         model=COMPUTER_USE_MODEL,
                         previous_response_id=response.id,
-                        tools=[CUA_TOOL_CONFIG],
+                        tools=_CUA_TOOLS,
                         input=input_content,
                         truncation=API_TRUNCATION_AUTO
                     )
                 except Exception as e:
-                    self.logger.error(f"Error in CUA API call: {e}")
-                    return f"{FAILED_PREFIX}: API call error: {e}"
+                    self.logger.error("Error in CUA API call: %s", e)
+                    return _unsuccessful(f"{FAILED_PREFIX}: API call error: {e}")
             
-            self.logger.warning(f"CUA reached maximum iterations ({max_iterations})")
-            return COMPLETED_CUA_ITERATIONS
+            self.logger.warning("CUA reached maximum iterations (%s)", max_iterations)
+            return _unsuccessful(COMPLETED_CUA_ITERATIONS)
                 
         except Exception as e:
             error_msg = f"CUA workflow failed: {e}"
             self.logger.error(error_msg, exc_info=True)
-            return f"{FAILED_PREFIX}: {error_msg}"
+            return _unsuccessful(f"{FAILED_PREFIX}: {error_msg}")
     
     async def _execute_computer_action(self, computer, action):
         """Execute a computer action using the AsyncComputer interface."""
@@ -374,20 +482,20 @@ class CuaWorkflowRunner:
             # Screenshot will be taken after this method returns
             pass
         elif action_type == "click":
-            self.logger.info(f"Executing click at ({action.x}, {action.y}) with button {action.button}")
+            self.logger.info("Executing click at (%s, %s) with button %s", action.x, action.y, action.button)
             await computer.click(action.x, action.y, action.button)
             # Add extra wait for X.com UI to respond to clicks
             await asyncio.sleep(CLICK_RESPONSE_DELAY / 1000)
         elif action_type == "double_click":
-            self.logger.info(f"Executing double-click at ({action.x}, {action.y})")
+            self.logger.info("Executing double-click at (%s, %s)", action.x, action.y)
             await computer.double_click(action.x, action.y)
             await asyncio.sleep(CLICK_RESPONSE_DELAY / 1000)
         elif action_type == "type":
-            self.logger.info(f"Typing text: '{action.text}'")
+            self.logger.info("Typing text: '%s'", action.text)
             await computer.type(action.text)
             await asyncio.sleep(KEYPRESS_RESPONSE_DELAY / 1000)
         elif action_type == "keypress":
-            self.logger.info(f"Pressing keys: {action.keys}")
+            self.logger.info("Pressing keys: %s", action.keys)
             
             # Special handling for 'j' navigation to detect viewport displacement
             if action.keys == ['j'] or action.keys == 'j':
@@ -395,11 +503,10 @@ class CuaWorkflowRunner:
                 
                 # Take a screenshot before the 'j' keypress to establish baseline
                 try:
-                    before_screenshot = await computer.screenshot()
-                    before_size = len(before_screenshot)
-                    self.logger.info(f"Pre-navigation screenshot size: {before_size}")
+                    before_size = await _screenshot_size(computer)
+                    self.logger.info("Pre-navigation screenshot size: %s", before_size)
                 except Exception as e:
-                    self.logger.warning(f"Could not capture pre-navigation screenshot: {e}")
+                    self.logger.warning("Could not capture pre-navigation screenshot: %s", e)
                     before_size = 0
                 
                 # Execute the 'j' keypress
@@ -408,16 +515,15 @@ class CuaWorkflowRunner:
                 
                 # Take a screenshot after the 'j' keypress to check for displacement
                 try:
-                    after_screenshot = await computer.screenshot()
-                    after_size = len(after_screenshot)
-                    self.logger.info(f"Post-navigation screenshot size: {after_size}")
+                    after_size = await _screenshot_size(computer)
+                    self.logger.info("Post-navigation screenshot size: %s", after_size)
                     
                     # Detect potential viewport displacement
                     size_change_ratio = abs(after_size - before_size) / max(before_size, 1)
                     
                     if after_size < SCREENSHOT_MIN_SIZE_THRESHOLD or size_change_ratio > VIEWPORT_DISPLACEMENT_RATIO_THRESHOLD:
-                        self.logger.warning(f"⚠️ Potential viewport displacement detected!")
-                        self.logger.warning(f"Size change: {before_size} -> {after_size} (ratio: {size_change_ratio:.2f})")
+                        self.logger.warning("⚠️ Potential viewport displacement detected!")
+                        self.logger.warning("Size change: %s -> %s (ratio: %.2f)", before_size, after_size, size_change_ratio)
                         
                         # Attempt automatic viewport recovery
                         self.logger.info("🔧 Attempting automatic viewport recovery...")
@@ -431,8 +537,7 @@ class CuaWorkflowRunner:
                             await asyncio.sleep(UI_RESPONSE_DELAY / 1000)
                             
                             # Method 3: Re-navigate to home timeline if needed
-                            recovery_screenshot = await computer.screenshot()
-                            recovery_size = len(recovery_screenshot)
+                            recovery_size = await _screenshot_size(computer)
                             
                             if recovery_size > SCREENSHOT_MIN_SIZE_THRESHOLD:
                                 self.logger.info("✅ Viewport recovery successful")
@@ -440,18 +545,18 @@ class CuaWorkflowRunner:
                                 self.logger.warning("⚠️ Viewport recovery may have failed")
                                 
                         except Exception as recovery_error:
-                            self.logger.error(f"❌ Viewport recovery failed: {recovery_error}")
+                            self.logger.error("❌ Viewport recovery failed: %s", recovery_error)
                     else:
                         self.logger.info("✅ Navigation completed without viewport displacement")
                         
                 except Exception as e:
-                    self.logger.warning(f"Could not capture post-navigation screenshot: {e}")
+                    self.logger.warning("Could not capture post-navigation screenshot: %s", e)
             else:
                 # Normal keypress execution for non-'j' keys
                 await computer.keypress(action.keys)
                 await asyncio.sleep(KEYPRESS_RESPONSE_DELAY / 1000)
         elif action_type == "scroll":
-            self.logger.info(f"Scrolling at ({action.x}, {action.y}) by ({action.scroll_x}, {action.scroll_y})")
+            self.logger.info("Scrolling at (%s, %s) by (%s, %s)", action.x, action.y, action.scroll_x, action.scroll_y)
             await computer.scroll(action.x, action.y, action.scroll_x, action.scroll_y)
             await asyncio.sleep(SCROLL_RESPONSE_DELAY / 1000)
         elif action_type == "move":
@@ -463,4 +568,4 @@ class CuaWorkflowRunner:
             await computer.drag([(p.x, p.y) for p in action.path])
             await asyncio.sleep(UI_RESPONSE_DELAY / 1000)
         else:
-            self.logger.warning(f"Unknown computer action type: {action_type}") 
\ No newline at end of file
+            self.logger.warning("Unknown computer action type: %s", action_type) 
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""Fast JSON helpers for the X Agentic Unit.
+
+Uses `orjson` when it is installed and falls back to the standard library
+`json` module otherwise. Both paths emit compact, non-ASCII-escaped output.
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: "str | bytes") -> Any:
+    """Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If the input is not valid JSON (orjson's error
+            type subclasses it, so callers can catch either way).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
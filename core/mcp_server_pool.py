@@ -0,0 +1,191 @@
+"""Shared MCP server connections for the X Agentic Unit.
+
+This module provides a process-wide pool of MCPServerStdio instances keyed on
+their launch configuration, so that every OrchestratorAgent using the same
+Supabase credentials talks to a single `npx` subprocess and shares one cached
+tool list instead of spawning its own.
+
+A subprocess is bound to the event loop that started it, so the pool keeps one
+server per (configuration, event loop) pair. Once connected, a server stays up
+for later `async with` blocks on the same loop until `aclose()` is awaited, so
+memory operations don't pay a Node.js cold start each.
+"""
+
+import asyncio
+import functools
+import logging
+import weakref
+from dataclasses import dataclass, field
+from typing import Optional, Tuple
+
+import anyio
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED
+
+from agents.mcp.server import MCPServerStdio
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the MCP subprocess is gone and the connection must be re-opened; the MCP
+# client reports a dead subprocess as a closed stream or McpError(CONNECTION_CLOSED)
+_DEAD_SERVER_ERRORS = (
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    BrokenPipeError,
+    ConnectionResetError,
+    ProcessLookupError,
+)
+
+
+def _is_dead_server_error(exc: Optional[BaseException]) -> bool:
+    """Whether an error raised inside an `async with` block means the subprocess is gone."""
+    if isinstance(exc, McpError):
+        return exc.error.code == CONNECTION_CLOSED
+    return isinstance(exc, _DEAD_SERVER_ERRORS)
+
+
+@dataclass
+class _LoopServerState:
+    """Per-event-loop state of a shared MCP server."""
+    server: MCPServerStdio
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    refcount: int = 0
+    connected: bool = False
+    close_when_idle: bool = False
+
+
+class SharedMCPServer:
+    """Reference-counted async context manager around a pooled MCPServerStdio.
+
+    The first user on an event loop connects the server and it is kept alive
+    across `async with` blocks, so both overlapping and sequential users reuse
+    the same subprocess. Call `aclose()` before the event loop ends; the server
+    is cleaned up as soon as no `async with` block is using it. A block that
+    fails because the subprocess went away drops the connection so the next
+    user reconnects.
+
+    Usage:
+        shared = get_shared_mcp_server("npx", ("-y", "pkg"))
+        async with shared as server:
+            tools = await server.list_tools()
+        await shared.aclose()
+    """
+
+    def __init__(
+        self,
+        command: str,
+        args: Tuple[str, ...],
+        cache_tools_list: bool = True,
+        client_session_timeout_seconds: Optional[float] = None,
+    ) -> None:
+        """Initialize the shared server configuration.
+
+        Args:
+            command: Executable used to launch the MCP server.
+            args: Command-line arguments passed to the executable.
+            cache_tools_list: Whether the server caches its tool list.
+            client_session_timeout_seconds: Read timeout for the MCP client session.
+        """
+        self.command = command
+        self.args = args
+        self.cache_tools_list = cache_tools_list
+        self.client_session_timeout_seconds = client_session_timeout_seconds
+        self._states: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopServerState]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _state_for_running_loop(self) -> _LoopServerState:
+        """Return (creating if needed) the server state for the running event loop."""
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None:
+            state = _LoopServerState(
+                server=MCPServerStdio(
+                    params={"command": self.command, "args": list(self.args)},
+                    cache_tools_list=self.cache_tools_list,
+                    client_session_timeout_seconds=self.client_session_timeout_seconds,
+                )
+            )
+            self._states[loop] = state
+        return state
+
+    async def __aenter__(self) -> MCPServerStdio:
+        """Connect if needed and return the underlying server."""
+        state = self._state_for_running_loop()
+        if state.connected:
+            # Fast path: nothing here awaits, so the event loop cannot interleave
+            # another user and the lock is only needed to connect or clean up.
+            state.close_when_idle = False
+            state.refcount += 1
+            return state.server
+        async with state.lock:
+            if not state.connected:
+                logger.debug("Connecting shared MCP server: %s", self.command)
+                await state.server.connect()
+                state.connected = True
+            state.close_when_idle = False
+            state.refcount += 1
+        return state.server
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release one reference, dropping the connection if the subprocess died."""
+        state = self._state_for_running_loop()
+        dead = _is_dead_server_error(exc_val)
+        if not dead and (state.refcount > 1 or not state.close_when_idle):
+            # Fast path: not the last user of a server that is due to close.
+            state.refcount -= 1
+            return
+        async with state.lock:
+            state.refcount -= 1
+            if dead:
+                logger.warning(
+                    "Shared MCP server %s went away (%s); reconnecting on next use", self.command, exc_val
+                )
+                state.close_when_idle = True
+            if state.refcount == 0 and state.close_when_idle:
+                await self._cleanup(state)
+
+    async def aclose(self) -> None:
+        """Clean up the running loop's server once no `async with` block is using it."""
+        state = self._states.get(asyncio.get_running_loop())
+        if state is None:
+            return
+        async with state.lock:
+            state.close_when_idle = True
+            if state.refcount == 0:
+                await self._cleanup(state)
+
+    async def _cleanup(self, state: _LoopServerState) -> None:
+        """Clean up a connected server; must be called with `state.lock` held."""
+        state.close_when_idle = False
+        if not state.connected:
+            return
+        state.connected = False
+        logger.debug("Cleaning up shared MCP server: %s", self.command)
+        await state.server.cleanup()
+
+
+@functools.lru_cache(maxsize=4)
+def get_shared_mcp_server(
+    command: str,
+    args: Tuple[str, ...],
+    cache_tools_list: bool = True,
+    client_session_timeout_seconds: Optional[float] = None,
+) -> SharedMCPServer:
+    """Return the process-wide SharedMCPServer for a launch configuration.
+
+    Args:
+        command: Executable used to launch the MCP server.
+        args: Command-line arguments (as a hashable tuple) passed to the executable.
+        cache_tools_list: Whether the server caches its tool list.
+        client_session_timeout_seconds: Read timeout for the MCP client session.
+
+    Returns:
+        The SharedMCPServer shared by every caller with the same configuration.
+    """
+    return SharedMCPServer(
+        command=command,
+        args=args,
+        cache_tools_list=cache_tools_list,
+        client_session_timeout_seconds=client_session_timeout_seconds,
+    )
@@ -12,4 +12,10 @@ class CuaTask(BaseModel):
     """
     prompt: str
     start_url: Optional[str] = None
-    max_iterations: int = 30 
\ No newline at end of file
+    max_iterations: int = 30
+
+
+class CuaResult(BaseModel):
+    """The outcome of running a CuaTask in a CuaSessionManager session."""
+    success: bool
+    output: str 
\ No newline at end of file
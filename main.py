@@ -82,11 +82,15 @@ async def main_async():
         # Execute the evaluation
         from agents import Runner, RunConfig
         
-        result = await Runner.run(
-            orchestrator, 
-            input=input_prompt,
-            run_config=RunConfig(workflow_name="Spam_Prevention_Eval")
-        )
+        try:
+            result = await Runner.run(
+                orchestrator, 
+                input=input_prompt,
+                run_config=RunConfig(workflow_name="Spam_Prevention_Eval")
+            )
+        finally:
+            # Flush queued action logs and stop the MCP subprocess even if the run fails
+            await orchestrator.aclose()
         
         logger.info("\n" + "✨" * 60)
         logger.info("🎯 SPAM PREVENTION EVAL COMPLETED")
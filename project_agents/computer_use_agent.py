@@ -2,12 +2,14 @@
 Module defining a ComputerUseAgent that uses the ComputerTool for CUA tasks.
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 
 from agents import Agent, ModelSettings, function_tool, RunContextWrapper
-from core.cua_workflow import CuaWorkflowRunner
+from core.cua_session_manager import CuaSessionManager
 from core.models import CuaTask
-from typing import Any
+from typing import Any, AsyncIterator, Optional
 
 
 class ComputerUseAgent(Agent):
@@ -16,6 +18,10 @@ class ComputerUseAgent(Agent):
     def __init__(self) -> None:
         """Initialize the ComputerUseAgent with browser control capabilities."""
         self.logger = logging.getLogger(__name__)
+        # Warm browser session reused across tasks on one event loop (see session())
+        self._session: Optional[CuaSessionManager] = None
+        self._session_lock: Optional[asyncio.Lock] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
         
         super().__init__(
             name="Computer Use Agent",
@@ -54,8 +60,8 @@ class ComputerUseAgent(Agent):
     async def execute_cua_task(self, task: CuaTask) -> str:
         """Execute a structured CUA task using the centralized workflow runner.
         
-        This method creates a single-use CUA session for backward compatibility.
-        For persistent sessions, use CuaSessionManager directly.
+        The browser session is started on first use and kept warm for later tasks
+        on the same event loop; tasks run one at a time. Call `aclose()` when done.
         
         Args:
             task: The CuaTask object containing prompt, start_url, and configuration
@@ -63,19 +69,76 @@ class ComputerUseAgent(Agent):
         Returns:
             String describing the outcome of the CUA operation
         """
-        self.logger.info(f"ComputerUseAgent executing structured task: {task.prompt[:100]}...")
+        self.logger.info("ComputerUseAgent executing structured task: %.100s...", task.prompt)
         
         try:
-            # Import here to avoid circular dependency
-            from core.cua_session_manager import CuaSessionManager
-            
-            # Use session manager for proper lifecycle management
-            async with CuaSessionManager() as session:
-                result = await session.run_task(task)
+            async with self.session() as session:
+                result = (await session.run_task(task)).output
                 
-            self.logger.info(f"CUA task completed with result: {result[:200]}...")
+            self.logger.info("CUA task completed with result: %.200s...", result)
             return result
         except Exception as e:
             error_msg = f"CUA task execution failed: {e}"
             self.logger.error(error_msg, exc_info=True)
-            return f"FAILED: {error_msg}" 
\ No newline at end of file
+            return f"FAILED: {error_msg}"
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[CuaSessionManager]:
+        """Hold the warm browser session of the running event loop, starting it if needed.
+        
+        Holders are serialized, so one task (or one scheduled cycle) drives the
+        browser at a time. The browser stays open afterwards until `aclose()`.
+        
+        Yields:
+            The active CuaSessionManager
+        """
+        async with await self._lock_for_running_loop():
+            if self._session is not None and not self._session.is_active:
+                # The browser crashed or was closed: release what is left and relaunch
+                self.logger.warning("Warm CUA session is no longer connected; starting a new one")
+                stale, self._session = self._session, None
+                await stale.__aexit__(None, None, None)
+            if self._session is None:
+                session = CuaSessionManager()
+                await session.__aenter__()
+                self._session = session
+            yield self._session
+
+    async def _lock_for_running_loop(self) -> asyncio.Lock:
+        """Return the lock guarding the running loop's session, closing one left on another loop."""
+        loop = asyncio.get_running_loop()
+        if self._session_loop is not loop:
+            old_session, old_loop = self._session, self._session_loop
+            self._session = None
+            self._session_lock = asyncio.Lock()
+            self._session_loop = loop
+            if old_session is not None:
+                await self._close_on_loop(old_session, old_loop)
+        return self._session_lock
+
+    async def _close_on_loop(self, session: CuaSessionManager, loop: asyncio.AbstractEventLoop) -> None:
+        """Stop a session on the loop its browser is bound to."""
+        if loop.is_closed() or not loop.is_running():
+            self.logger.warning("Cannot stop CUA session: its event loop is no longer running")
+            return
+        try:
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(session.__aexit__(None, None, None), loop)
+            )
+        except Exception as e:
+            self.logger.error("Error stopping CUA session from a previous event loop: %s", e)
+
+    async def aclose(self) -> None:
+        """Stop the warm browser session, if any."""
+        if self._session_loop is None:
+            return
+        if self._session_loop is not asyncio.get_running_loop():
+            session, loop = self._session, self._session_loop
+            self._session = None
+            if session is not None:
+                await self._close_on_loop(session, loop)
+            return
+        async with self._session_lock:
+            if self._session is not None:
+                await self._session.__aexit__(None, None, None)
+                self._session = None
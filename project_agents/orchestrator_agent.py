@@ -1,17 +1,46 @@
 """Orchestrator agent module for managing workflows."""
 
 import asyncio
-import json
+import dataclasses
+import functools
 import logging
-from typing import Any, TYPE_CHECKING
+import re
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterable, Iterator, NamedTuple, Optional, Sequence, TYPE_CHECKING
 from dataclasses import dataclass
 
-from agents import Agent, RunContextWrapper, function_tool, Runner
-from agents.mcp.server import MCPServerStdio
+from agents import Agent, FunctionTool, RunConfig, RunContextWrapper, function_tool, Runner
+from core import json_utils
+from core.background_loop import run_coroutine_sync
 from core.config import settings
-from core.models import CuaTask
-from core.constants import ORCHESTRATOR_MODEL
-from core.cua_instructions import get_tweet_like_prompt
+from core.mcp_server_pool import get_shared_mcp_server
+from core.models import CuaResult, CuaTask
+from core.constants import (
+    ACTION_LOG_BATCH_SIZE,
+    ACTION_LOG_QUEUE_MAXSIZE,
+    MEMORY_CHECK_CACHE_MAX_ENTRIES,
+    CONTENT_IDEA_DEDUP_CAPACITY,
+    CUA_PROMPT_CACHE_MAX_ENTRIES,
+    FAILED_PREFIX,
+    LAST_MENTION_ID_CACHE_TTL_SECONDS,
+    MENTIONS_POLL_BACKOFF_INITIAL_SECONDS,
+    MENTIONS_POLL_BACKOFF_MAX_SECONDS,
+    ORCHESTRATOR_MODEL,
+    PG_POOL_CONNECT_TIMEOUT_SECONDS,
+    PG_POOL_RETRY_DELAY_SECONDS,
+    TOOL_RESULT_CACHE_MAX_ENTRIES,
+    TOOL_RESULT_CACHE_TTL_SECONDS,
+    X_BASE_URL,
+)
+from core.cua_instructions import (
+    create_smart_cua_task_prompt,
+    get_search_and_like_tweet_prompt,
+    get_timeline_reading_prompt,
+    get_tweet_like_prompt,
+)
 from core.db_manager import (
     get_agent_state,
     get_approved_reply_tasks,
@@ -31,23 +60,553 @@ from tools.x_api_tools import (
 )
 from tools.memory_tools import (
     log_action_to_memory,
+    log_actions_to_memory_bulk,
+    copy_actions_to_postgres,
     retrieve_recent_actions_from_memory,
     save_content_idea_to_memory,
+    save_content_ideas_to_memory_bulk,
     get_unused_content_ideas_from_memory,
     mark_content_idea_as_used,
     check_recent_target_interactions,
 )
 from pydantic import ValidationError
 
+try:
+    import asyncpg
+except ImportError:  # Optional: without it, action logs always go through the MCP server
+    asyncpg = None
+
 if TYPE_CHECKING:
     from core.cua_session_manager import CuaSessionManager
 
+# Keywords (plurals and 'dataset' included) that mark a research sentence as a potential AI/ML content idea
+_IDEA_KEYWORD_RE = re.compile(
+    r'\b(?:ai|ml|artificial intelligence|machine learning|llms?|models?|data(?:sets?)?)\b', re.IGNORECASE
+)
+
+# Yields the same pieces as str.split('. ') one at a time, without building the full list
+_SENTENCE_RE = re.compile(r'(?:^|(?<=\. ))(?:[^.]|\.(?! ))*')
+
+
+def _is_idea_sentence(sentence: str) -> bool:
+    """Whether a research sentence is a plausible AI/ML content idea."""
+    # The length check runs first so the keyword cache only ever holds short sentences
+    return 50 < len(sentence) < 200 and _has_idea_keyword(sentence)
+
+
+@functools.lru_cache(maxsize=2048)
+def _has_idea_keyword(sentence: str) -> bool:
+    return _IDEA_KEYWORD_RE.search(sentence) is not None
+
+
+class _ActionLogEntry(NamedTuple):
+    """A queued action log; turned into a memory-store row only when the batch is written."""
+    action_type: str
+    result: str
+    target: Optional[str]
+    details: Optional[dict]
+    truncate: Optional[dict]
+
+
+class _EmptyPollBackoff:
+    """Exponential backoff after empty polls; kept at module scope so it outlives each agent."""
+
+    __slots__ = ("initial", "maximum", "delay", "last_empty_ts")
+
+    def __init__(self, initial: float, maximum: float) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.delay = initial
+        self.last_empty_ts: Optional[float] = None
+
+    def should_skip(self) -> bool:
+        """Whether the last poll was empty less than the current delay ago."""
+        return self.last_empty_ts is not None and time.monotonic() - self.last_empty_ts < self.delay
+
+    def record_empty(self) -> None:
+        """Note an empty poll, doubling the delay if the previous poll was empty too."""
+        if self.last_empty_ts is not None:
+            self.delay = min(self.delay * 2, self.maximum)
+        self.last_empty_ts = time.monotonic()
+
+    def reset(self) -> None:
+        """Poll normally again after a poll that returned data."""
+        self.last_empty_ts = None
+        self.delay = self.initial
+
+
+# Empty-poll backoff for get_mentions so idle scheduled cycles (each with a new agent)
+# don't burn X API rate limit
+_mentions_poll_backoff = _EmptyPollBackoff(
+    MENTIONS_POLL_BACKOFF_INITIAL_SECONDS, MENTIONS_POLL_BACKOFF_MAX_SECONDS
+)
+
+
+class _CachedAgentState:
+    """One agent_state value read through a process-wide TTL cache.
+
+    Our own saves update the cache directly; the TTL bounds how long a change made by
+    another writer can go unnoticed.
+    """
+
+    __slots__ = ("key", "ttl", "value", "loaded_at")
+
+    def __init__(self, key: str, ttl: float) -> None:
+        self.key = key
+        self.ttl = ttl
+        self.value: Optional[str] = None
+        self.loaded_at: Optional[float] = None
+
+    def get(self) -> Optional[str]:
+        """Return the cached value, reading the state store if it is missing or expired."""
+        if self.loaded_at is None or time.monotonic() - self.loaded_at >= self.ttl:
+            self.value = get_agent_state(self.key)
+            self.loaded_at = time.monotonic()
+        return self.value
+
+    def save(self, value: str) -> None:
+        """Write the value to the state store and the cache."""
+        save_agent_state(self.key, value)
+        self.value = value
+        self.loaded_at = time.monotonic()
+
+    def invalidate(self) -> None:
+        """Force the next get() to read the state store."""
+        self.loaded_at = None
+
+
+_last_mention_id = _CachedAgentState(
+    "last_processed_mention_id_default_user", LAST_MENTION_ID_CACHE_TTL_SECONDS
+)
+
+
+# Insertion-ordered set of content idea keys (source URL or summary) saved by this process.
+# It only saves round-trips: the INSERT itself skips ideas already stored, used or not.
+_seen_content_ideas: dict[str, None] = {}
+
+
+def _remember_content_idea(key: str) -> None:
+    """Record a saved content idea key, evicting the oldest beyond capacity."""
+    _seen_content_ideas[key] = None
+    if len(_seen_content_ideas) > CONTENT_IDEA_DEDUP_CAPACITY:
+        del _seen_content_ideas[next(iter(_seen_content_ideas))]
+
+
 @dataclass
 class AppContext:
     """Application context containing the persistent CUA session."""
     cua_session: 'CuaSessionManager'
 
 
+@dataclass(frozen=True)
+class SmartCuaTaskHandoff:
+    """Result of OrchestratorAgent._create_smart_cua_task."""
+    prompt: str
+    start_url: str
+    max_iterations: int
+    ok: bool = True
+    error: Optional[str] = None
+
+
+# ==================== TOOL WRAPPERS ====================
+# Tools are decorated once at import time so schema generation is not repeated
+# per OrchestratorAgent instance; _bind_tool attaches them to a specific agent.
+
+_current_orchestrator: ContextVar["OrchestratorAgent"] = ContextVar("_current_orchestrator")
+
+
+async def _bounded_gather(coros: Iterable[Awaitable[Any]], limit: int) -> list[Any]:
+    """Await coroutines concurrently, at most `limit` at a time.
+
+    Results are returned in input order; exceptions are returned rather than raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coro: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(coro) for coro in coros), return_exceptions=True)
+
+
+def _tool_json(result: Any) -> str:
+    """Serialize a tool result as compact JSON to keep the LLM's next-turn input small."""
+    return json_utils.dumps(result)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify_target(target: str) -> tuple[str, str]:
+    """Classify a like target as ('url', target) or ('query', normalized_query).
+
+    Search queries are stripped and lower-cased so that equivalent queries share
+    one memory key.
+    """
+    if target.startswith(('http://', 'https://')):
+        return 'url', target
+    return 'query', target.strip().lower()
+
+
+# The like/timeline prompt builders are memoized in core.cua_instructions; the smart task
+# prompt takes a context dict, so it is memoized here on the context's sorted items.
+@functools.lru_cache(maxsize=CUA_PROMPT_CACHE_MAX_ENTRIES)
+def _cached_smart_cua_task_prompt(task_description: str, context_items: tuple) -> tuple:
+    """Memoized create_smart_cua_task_prompt keyed on the sorted context items."""
+    return create_smart_cua_task_prompt(task_description, dict(context_items))
+
+
+def _smart_cua_task_prompt(task_description: str, context: Optional[dict] = None) -> tuple:
+    """create_smart_cua_task_prompt, memoized when the context values are hashable."""
+    context_items = tuple(sorted((context or {}).items()))
+    try:
+        return _cached_smart_cua_task_prompt(task_description, context_items)
+    except TypeError:
+        return create_smart_cua_task_prompt(task_description, context)
+
+
+@dataclass(frozen=True)
+class _LikeMode:
+    """How _enhanced_like_tweet_with_memory handles one kind of like target."""
+    action_types: tuple[str, ...]
+    hours_back: int
+    max_iterations: int
+    log_prefix: str
+    skip_message: str
+    default_reason: str
+    memory_target: Callable[[str], str]
+    start_url: Callable[[str], str]
+    prompt: Callable[[str], str]
+
+
+_LIKE_MODES: dict[str, _LikeMode] = {
+    # A specific tweet URL
+    'url': _LikeMode(
+        action_types=('like_tweet', 'reply_to_tweet'),
+        hours_back=24,
+        max_iterations=20,  # Reasonable default for like operations
+        log_prefix='like_tweet',
+        skip_message="⏭️ Skipping tweet like - {reason}",
+        default_reason='Recent interaction detected',
+        memory_target=lambda url: url,
+        start_url=lambda url: url,
+        prompt=get_tweet_like_prompt,
+    ),
+    # A search query: search X and like matching tweets
+    'query': _LikeMode(
+        action_types=('search_and_like', 'like_tweet'),
+        hours_back=2,  # Shorter window for search queries
+        max_iterations=25,  # More iterations needed for search-and-like
+        log_prefix='search_and_like',
+        skip_message="⏭️ Skipping search-and-like for '{target}' - {reason}",
+        default_reason='Recent similar action detected',
+        memory_target=lambda query: f"search_and_like:{query}",
+        start_url=lambda query: X_BASE_URL,  # Start from X.com home page
+        prompt=lambda query: get_search_and_like_tweet_prompt(query, max_iterations=25),
+    ),
+}
+
+
+def _bind_tool(tool: FunctionTool, orchestrator: "OrchestratorAgent") -> FunctionTool:
+    """Return a copy of a module-level tool that runs against the given orchestrator."""
+
+    async def _on_invoke_tool(ctx: RunContextWrapper[Any], input: str) -> Any:
+        token = _current_orchestrator.set(orchestrator)
+        try:
+            return await tool.on_invoke_tool(ctx, input)
+        finally:
+            _current_orchestrator.reset(token)
+
+    return dataclasses.replace(tool, on_invoke_tool=_on_invoke_tool)
+
+
+# Expose process_new_mentions_workflow as a tool for LLM-driven orchestration
+@function_tool(
+    name_override="process_new_mentions",
+    description_override="Process new X mentions: fetch mentions, draft replies, request human review, and update state",
+)
+async def _process_new_mentions_tool(ctx: RunContextWrapper[AppContext]) -> None:
+    """Tool wrapper for process_new_mentions_workflow."""
+    orchestrator = _current_orchestrator.get()
+    await orchestrator.process_new_mentions_workflow()
+
+
+# Expose process_approved_replies_workflow as a tool for human-approved replies processing
+@function_tool(
+    name_override="process_approved_replies",
+    description_override="Process approved human-reviewed replies: post approved replies and update review status",
+)
+async def _process_approved_replies_tool(ctx: RunContextWrapper[AppContext]) -> None:
+    """Tool wrapper for process_approved_replies_workflow."""
+    orchestrator = _current_orchestrator.get()
+    await orchestrator.process_approved_replies_workflow()
+
+
+# Run both reply workflows side by side; they touch independent X API endpoints and review rows
+@function_tool(
+    name_override="process_mentions_and_approved_replies",
+    description_override="Process new X mentions and post approved human-reviewed replies concurrently",
+)
+async def _process_mentions_and_approved_replies_tool(ctx: RunContextWrapper[AppContext]) -> None:
+    """Tool wrapper running process_new_mentions_workflow and process_approved_replies_workflow concurrently."""
+    orchestrator = _current_orchestrator.get()
+    results = await asyncio.gather(
+        orchestrator.process_new_mentions_workflow(),
+        orchestrator.process_approved_replies_workflow(),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+
+class _ActionOutcome:
+    """What a `_logged_action` block records on success; fill it in inside the block."""
+
+    __slots__ = ("result", "details", "truncate")
+
+    def __init__(self) -> None:
+        self.result = 'SUCCESS'
+        self.details: Optional[dict] = None
+        self.truncate: Optional[dict] = None
+
+    def record_cua_result(self, cua_result: CuaResult, details: dict, truncate: Optional[dict] = None) -> None:
+        """Record a CUA run: SUCCESS/COMPLETED from its flag, plus its output (cut to 200 chars)."""
+        self.result = 'SUCCESS' if cua_result.success else 'COMPLETED'
+        details['result'] = cua_result.output
+        self.details = details
+        self.truncate = truncate or {'result': 200}
+
+
+@contextmanager
+def _logged_action(
+    orchestrator: "OrchestratorAgent",
+    action_type: str,
+    target: Optional[str] = None,
+    failed_action_type: Optional[str] = None,
+) -> Iterator[_ActionOutcome]:
+    """Log the enclosed tool action to memory in the background once it finishes.
+
+    On success the outcome filled in by the block is logged under `action_type`; if the
+    block raises, a FAILED entry with the error is logged under `failed_action_type`
+    (default: `action_type`) and the exception propagates.
+    """
+    outcome = _ActionOutcome()
+    try:
+        yield outcome
+    except Exception as e:
+        orchestrator._log_action_in_background(
+            action_type=failed_action_type or action_type,
+            result='FAILED',
+            target=target,
+            details={'error': str(e)},
+        )
+        raise
+    orchestrator._log_action_in_background(
+        action_type=action_type,
+        result=outcome.result,
+        target=target,
+        details=outcome.details,
+        truncate=outcome.truncate,
+    )
+
+
+# Add memory-driven decision tools
+@function_tool(
+    name_override="enhanced_like_tweet_with_memory",
+    description_override="Like a tweet with memory-driven spam prevention. Checks recent interactions to avoid overengaging with the same target. Executes directly using persistent CUA session.",
+)
+async def _enhanced_like_tweet_with_memory_tool(ctx: RunContextWrapper[AppContext], tweet_url: str) -> str:
+    """Tool wrapper for enhanced tweet liking with memory."""
+    orchestrator = _current_orchestrator.get()
+    task = await orchestrator._enhanced_like_tweet_with_memory(tweet_url)
+    if isinstance(task, CuaTask):
+        # Execute the task directly using the persistent session
+        try:
+            with _logged_action(orchestrator, 'like_tweet_executed', tweet_url, 'like_tweet_failed') as outcome:
+                cua_result = await ctx.context.cua_session.run_task(task)
+                outcome.record_cua_result(cua_result, {})
+            if cua_result.success:
+                return f"✅ Successfully liked tweet: {cua_result.output}"
+            return f"❌ Failed to like tweet: {cua_result.output}"
+        except Exception as e:
+            return f"❌ Failed to like tweet: {e}"
+    else:
+        # Task was skipped due to memory check
+        return str(task)
+
+
+@function_tool(
+    name_override="enhanced_research_with_memory",
+    description_override="Research topics with automatic content idea saving to memory. Extracts and stores potential content ideas for future use.",
+)
+async def _enhanced_research_with_memory_tool(ctx: RunContextWrapper[AppContext], query: str) -> str:
+    """Tool wrapper for enhanced research with memory."""
+    orchestrator = _current_orchestrator.get()
+    return await orchestrator._cached_tool_call(
+        "enhanced_research_with_memory", (query,),
+        lambda: orchestrator._enhanced_research_with_memory(query),
+    )
+
+
+@function_tool(
+    name_override="get_unused_content_ideas",
+    description_override="Retrieve unused content ideas from strategic memory for posting. Can filter by topic category.",
+)
+async def _get_unused_content_ideas_tool(ctx: RunContextWrapper[AppContext], topic_category: str = None, limit: int = 10) -> str:
+    """Tool wrapper for retrieving unused content ideas."""
+    orchestrator = _current_orchestrator.get()
+    result = await orchestrator._cached_tool_call(
+        "get_unused_content_ideas", (topic_category, limit),
+        lambda: orchestrator._get_unused_content_ideas_from_memory(topic_category, limit),
+    )
+    return _tool_json(result)
+
+
+@function_tool(
+    name_override="check_recent_actions",
+    description_override="Check recent agent actions to avoid duplication and make strategic decisions based on history.",
+)
+async def _check_recent_actions_tool(ctx: RunContextWrapper[AppContext], action_type: str = None, hours_back: int = 24) -> str:
+    """Tool wrapper for checking recent actions."""
+    orchestrator = _current_orchestrator.get()
+    result = await orchestrator._cached_tool_call(
+        "check_recent_actions", (action_type, hours_back),
+        lambda: orchestrator._retrieve_recent_actions_from_memory(action_type, hours_back),
+    )
+    return _tool_json(result)
+
+
+# Add direct CUA execution tools using persistent session
+@function_tool(
+    name_override="execute_cua_task_direct",
+    description_override="Execute a CUA task directly using the persistent browser session. Provide a clear task description and it will be converted to an optimized CUA workflow.",
+)
+async def _execute_cua_task_direct_tool(ctx: RunContextWrapper[AppContext], task_description: str) -> str:
+    """Tool wrapper for direct CUA task execution using persistent session."""
+    orchestrator = _current_orchestrator.get()
+    try:
+        with _logged_action(orchestrator, 'cua_task_executed', task_description, 'cua_task_failed') as outcome:
+            # Create smart task from description
+            prompt, start_url, max_iterations = _smart_cua_task_prompt(task_description)
+            task = CuaTask(
+                prompt=prompt,
+                start_url=start_url,
+                max_iterations=max_iterations
+            )
+
+            # Execute using persistent session
+            cua_result = await ctx.context.cua_session.run_task(task)
+            outcome.record_cua_result(
+                cua_result,
+                {'prompt': prompt, 'start_url': start_url, 'max_iterations': max_iterations},
+                truncate={'prompt': 100, 'result': 200},
+            )
+        return f"✅ CUA task completed: {cua_result.output}"
+    except Exception as e:
+        return f"❌ CUA task failed: {e}"
+
+
+@function_tool(
+    name_override="read_timeline_with_session",
+    description_override="Read tweets from the home timeline using the persistent browser session. Specify number of tweets to read (default: 5).",
+)
+async def _read_timeline_with_session_tool(ctx: RunContextWrapper[AppContext], num_tweets: int = 5) -> str:
+    """Tool wrapper for reading timeline using persistent session."""
+    orchestrator = _current_orchestrator.get()
+    try:
+        with _logged_action(orchestrator, 'timeline_read', f"read_{num_tweets}_tweets", 'timeline_read_failed') as outcome:
+            task = CuaTask(
+                prompt=get_timeline_reading_prompt(num_tweets),
+                start_url=X_BASE_URL,
+                max_iterations=30
+            )
+            cua_result = await ctx.context.cua_session.run_task(task)
+            outcome.record_cua_result(cua_result, {'num_tweets': num_tweets})
+        return f"📱 Timeline reading completed: {cua_result.output}"
+    except Exception as e:
+        return f"❌ Timeline reading failed: {e}"
+
+
+@function_tool(
+    name_override="search_and_engage_with_session",
+    description_override="Search X for topics and engage with relevant content using the persistent browser session. Provide a search query.",
+)
+async def _search_and_engage_with_session_tool(ctx: RunContextWrapper[AppContext], search_query: str) -> str:
+    """Tool wrapper for searching and engaging using persistent session."""
+    orchestrator = _current_orchestrator.get()
+    try:
+        with _logged_action(orchestrator, 'search_and_engage', search_query, 'search_and_engage_failed') as outcome:
+            task = CuaTask(
+                prompt=get_search_and_like_tweet_prompt(search_query, max_iterations=25),
+                start_url=X_BASE_URL,
+                max_iterations=25
+            )
+            cua_result = await ctx.context.cua_session.run_task(task)
+            outcome.record_cua_result(cua_result, {'search_query': search_query})
+        return f"🔍 Search and engage completed: {cua_result.output}"
+    except Exception as e:
+        return f"❌ Search and engage failed: {e}"
+
+
+# Add profile metrics tool
+@function_tool(
+    name_override="get_profile_metrics",
+    description_override="Get AIified account statistics (followers, following, tweet count, listed count) via X API v2.",
+)
+async def _get_profile_metrics_tool(ctx: RunContextWrapper[AppContext]) -> str:
+    """Tool wrapper for fetching @AIified account metrics."""
+    orchestrator = _current_orchestrator.get()
+    try:
+        with _logged_action(orchestrator, "profile_metrics_snapshot") as outcome:
+            metrics = await asyncio.to_thread(get_profile_metrics)
+            outcome.details = metrics
+        return _tool_json(metrics)
+    except Exception as e:
+        return f"❌ Failed to fetch profile metrics: {e}"
+
+
+# System prompt for the OrchestratorAgent
+_ORCHESTRATOR_INSTRUCTIONS = """\
+You are "AIified", an autonomous, multi-modal X (Twitter) agent whose sole mission is to grow the @AIified account by cultivating genuine, high-quality engagement within the AI / LLM / Machine-Learning community.
+
+─── CORE LOOP ───
+In EVERY cycle you must:
+1. Analyse:   Review strategic memory (Supabase) + fresh situational data (timeline, mentions, ideas).
+2. Decide:     Select EXACTLY ONE highest-value action from the Action Menu.
+3. Act:        Execute it with the most appropriate tool(s).
+4. Reflect:    Log what you did and why; note early engagement signals.
+
+Your goal is NOT to do everything – it is to pick the SINGLE action that maximises near- and long-term engagement.
+
+─── STRATEGIC MEMORY (SUPABASE) ───
+• agent_actions       – every action we or sub-agents perform.
+• content_ideas       – harvested topics awaiting posting.
+• tweet_performance   – (optional) performance metrics you can write to.
+ALWAYS query memory (`check_recent_actions`) before outward interactions to prevent spam.
+
+─── ACTION MENU ───
+① Content Research      → `enhanced_research_with_memory`          (default when idle)
+② Draft / Post Content  → ContentCreationAgent + `execute_cua_task_direct`
+③ Engage Timeline       → `read_timeline_with_session` → selective `enhanced_like_tweet_with_memory`
+④ Reply to Mentions     → `process_new_mentions` (`process_mentions_and_approved_replies` to also post approved replies)
+⑤ Network Expansion     → `search_and_engage_with_session`
+⑥ Maintenance / Utils   → other available tools when justified
+
+─── GUIDING PRINCIPLES ───
+• MEMORY-FIRST • QUALITY > QUANTITY • VALUE-ADD • TOPICAL RELEVANCE • HIL COMPLIANCE • PLATFORM RULES • RATE LIMIT AWARENESS • ASK FOR HELP when unsure (use `request_strategic_direction`).
+
+─── OUTPUT STYLE ───
+Replies / tweets: conversational, concise (< 280 chars), professional yet approachable; minimal emojis; thread drafts numbered.
+
+─── PERSISTENCE REMINDER ───
+Keep going until the selected action is fully executed (including any necessary follow-up tool calls) before yielding control.
+
+─── TOOL-CALLING REMINDER ───
+Prefer the most specific tool; never guess outcomes – call the tool.
+
+Think step-by-step INTERNALLY, but output only the required tool calls or final user-visible actions. Do NOT expose chain-of-thought.
+"""
+
+
 class OrchestratorAgent(Agent[AppContext]):
     """Central coordinator agent for managing X platform interactions."""
 
@@ -58,323 +617,71 @@ class OrchestratorAgent(Agent[AppContext]):
         self.research_agent = ResearchAgent()
         self.x_interaction_agent = XInteractionAgent()
 
-        # Initialize the Supabase MCP Server configuration (connection will be managed per-request)
-        self.supabase_mcp_server = MCPServerStdio(
-            params={
-                "command": "cmd",
-                "args": [
-                    "/c",
-                    "npx",
-                    "-y",
-                    "@supabase/mcp-server-supabase@latest",
-                    "--access-token",
-                    settings.supabase_access_token
-                ]
-            },
+        # Background writer that batches action logs off the request path (started on first use)
+        self._log_queue: Optional[asyncio.Queue] = None
+        self._log_writer_task: Optional[asyncio.Task] = None
+
+        # Short-lived FIFO memo of target interaction checks: key -> (monotonic timestamp, result)
+        self._memcheck_cache: "OrderedDict[tuple, tuple[float, dict]]" = OrderedDict()
+        # Per-tool memo of read-only tool results: tool name -> {args: (monotonic timestamp, result)}
+        self._tool_results: dict[str, "OrderedDict[tuple, tuple[float, Any]]"] = {}
+        # Bounds concurrent uncached checks; created per event loop (see _memory_check_semaphore)
+        self._memcheck_semaphore: Optional[asyncio.Semaphore] = None
+        self._memcheck_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Direct Postgres pool for action logs (only with SUPABASE_POSTGRES_DSN and asyncpg)
+        self._pg_pool: Optional[Any] = None
+        self._pg_pool_loop: Optional[asyncio.AbstractEventLoop] = None
+        # time.monotonic() before which a failed connect is not retried
+        self._pg_pool_retry_at = 0.0
+
+        # Shared Supabase MCP Server: one subprocess per configuration (connection is managed per-request)
+        self.supabase_mcp_server = get_shared_mcp_server(
+            "cmd",
+            (
+                "/c",
+                "npx",
+                "-y",
+                "@supabase/mcp-server-supabase@latest",
+                "--access-token",
+                settings.supabase_access_token,
+            ),
             # Cache the tool list for performance. We can invalidate it later if needed.
             cache_tools_list=True,
             # Increase timeout for Supabase server startup
-            client_session_timeout_seconds=15.0
+            client_session_timeout_seconds=15.0,
         )
 
         super().__init__(
             name="Orchestrator Agent",
-            instructions=(
-                """
-                You are "AIified", an autonomous, multi-modal X (Twitter) agent whose sole mission is to grow the @AIified account by cultivating genuine, high-quality engagement within the AI / LLM / Machine-Learning community.
-
-                ─── CORE LOOP ───
-                In EVERY cycle you must:
-                1. Analyse:   Review strategic memory (Supabase) + fresh situational data (timeline, mentions, ideas).
-                2. Decide:     Select EXACTLY ONE highest-value action from the Action Menu.
-                3. Act:        Execute it with the most appropriate tool(s).
-                4. Reflect:    Log what you did and why; note early engagement signals.
-
-                Your goal is NOT to do everything – it is to pick the SINGLE action that maximises near- and long-term engagement.
-
-                ─── STRATEGIC MEMORY (SUPABASE) ───
-                • agent_actions       – every action we or sub-agents perform.
-                • content_ideas       – harvested topics awaiting posting.
-                • tweet_performance   – (optional) performance metrics you can write to.
-                ALWAYS query memory (`check_recent_actions`) before outward interactions to prevent spam.
-
-                ─── ACTION MENU ───
-                ① Content Research      → `enhanced_research_with_memory`          (default when idle)
-                ② Draft / Post Content  → ContentCreationAgent + `execute_cua_task_direct`
-                ③ Engage Timeline       → `read_timeline_with_session` → selective `enhanced_like_tweet_with_memory`
-                ④ Reply to Mentions     → `process_new_mentions`
-                ⑤ Network Expansion     → `search_and_engage_with_session`
-                ⑥ Maintenance / Utils   → other available tools when justified
-
-                ─── GUIDING PRINCIPLES ───
-                • MEMORY-FIRST • QUALITY > QUANTITY • VALUE-ADD • TOPICAL RELEVANCE • HIL COMPLIANCE • PLATFORM RULES • RATE LIMIT AWARENESS • ASK FOR HELP when unsure (use `request_strategic_direction`).
-
-                ─── OUTPUT STYLE ───
-                Replies / tweets: conversational, concise (< 280 chars), professional yet approachable; minimal emojis; thread drafts numbered.
-
-                ─── PERSISTENCE REMINDER ───
-                Keep going until the selected action is fully executed (including any necessary follow-up tool calls) before yielding control.
-
-                ─── TOOL-CALLING REMINDER ───
-                Prefer the most specific tool; never guess outcomes – call the tool.
-
-                Think step-by-step INTERNALLY, but output only the required tool calls or final user-visible actions. Do NOT expose chain-of-thought.
-                """
-            ),
+            instructions=_ORCHESTRATOR_INSTRUCTIONS,
             model=ORCHESTRATOR_MODEL,
             tools=[],
             # Remove MCP servers from agent initialization - will be handled per-request
             # mcp_servers=[self.supabase_mcp_server],
         )
 
-        # Expose process_new_mentions_workflow as a tool for LLM-driven orchestration
-        @function_tool(
-            name_override="process_new_mentions",
-            description_override="Process new X mentions: fetch mentions, draft replies, request human review, and update state",
-        )
-        async def _process_new_mentions_tool(ctx: RunContextWrapper[AppContext]) -> None:
-            """Tool wrapper for process_new_mentions_workflow."""
-            await self.process_new_mentions_workflow()
-
-        self.tools.append(_process_new_mentions_tool)
-
-        # Expose process_approved_replies_workflow as a tool for human-approved replies processing
-        @function_tool(
-            name_override="process_approved_replies",
-            description_override="Process approved human-reviewed replies: post approved replies and update review status",
-        )
-        async def _process_approved_replies_tool(ctx: RunContextWrapper[AppContext]) -> None:
-            """Tool wrapper for process_approved_replies_workflow."""
-            await self.process_approved_replies_workflow()
-
-        self.tools.append(_process_approved_replies_tool)
-
-        # Add ResearchAgent as a tool for AI/ML topic research
-        self.tools.append(
+        # Register every tool in one place
+        self.tools = [
+            _bind_tool(_process_new_mentions_tool, self),
+            _bind_tool(_process_approved_replies_tool, self),
+            _bind_tool(_process_mentions_and_approved_replies_tool, self),
+            # ResearchAgent as a tool for AI/ML topic research
             self.research_agent.as_tool(
                 tool_name="find_ai_ml_news_or_topics",
                 tool_description="Searches the web for recent news, developments, or interesting topics in AI, LLMs, and Machine Learning. Input should be a specific query or 'general latest AI news'."
-            )
-        )
-
-        # Add memory-driven decision tools
-        @function_tool(
-            name_override="enhanced_like_tweet_with_memory",
-            description_override="Like a tweet with memory-driven spam prevention. Checks recent interactions to avoid overengaging with the same target. Executes directly using persistent CUA session.",
-        )
-        async def _enhanced_like_tweet_with_memory_tool(ctx: RunContextWrapper[AppContext], tweet_url: str) -> str:
-            """Tool wrapper for enhanced tweet liking with memory."""
-            task = await self._enhanced_like_tweet_with_memory(tweet_url)
-            if isinstance(task, CuaTask):
-                # Execute the task directly using the persistent session
-                try:
-                    result = await ctx.context.cua_session.run_task(task)
-                    
-                    # Log the successful action to memory
-                    await self._log_action_to_memory(
-                        action_type='like_tweet_executed',
-                        result='SUCCESS',
-                        target=tweet_url,
-                        details={'cua_result': result[:200]}
-                    )
-                    
-                    return f"✅ Successfully liked tweet: {result}"
-                except Exception as e:
-                    # Log the failed action to memory
-                    await self._log_action_to_memory(
-                        action_type='like_tweet_failed',
-                        result='FAILED',
-                        target=tweet_url,
-                        details={'error': str(e)}
-                    )
-                    return f"❌ Failed to like tweet: {e}"
-            else:
-                # Task was skipped due to memory check
-                return str(task)
-
-        @function_tool(
-            name_override="enhanced_research_with_memory",
-            description_override="Research topics with automatic content idea saving to memory. Extracts and stores potential content ideas for future use.",
-        )
-        async def _enhanced_research_with_memory_tool(ctx: RunContextWrapper[AppContext], query: str) -> str:
-            """Tool wrapper for enhanced research with memory."""
-            return await self._enhanced_research_with_memory(query)
-
-        @function_tool(
-            name_override="get_unused_content_ideas",
-            description_override="Retrieve unused content ideas from strategic memory for posting. Can filter by topic category.",
-        )
-        async def _get_unused_content_ideas_tool(ctx: RunContextWrapper[AppContext], topic_category: str = None, limit: int = 10) -> str:
-            """Tool wrapper for retrieving unused content ideas."""
-            result = await self._get_unused_content_ideas_from_memory(topic_category, limit)
-            return json.dumps(result, indent=2)
-
-        @function_tool(
-            name_override="check_recent_actions",
-            description_override="Check recent agent actions to avoid duplication and make strategic decisions based on history.",
-        )
-        async def _check_recent_actions_tool(ctx: RunContextWrapper[AppContext], action_type: str = None, hours_back: int = 24) -> str:
-            """Tool wrapper for checking recent actions."""
-            result = await self._retrieve_recent_actions_from_memory(action_type, hours_back)
-            return json.dumps(result, indent=2)
-
-        # Add direct CUA execution tools using persistent session
-        @function_tool(
-            name_override="execute_cua_task_direct",
-            description_override="Execute a CUA task directly using the persistent browser session. Provide a clear task description and it will be converted to an optimized CUA workflow.",
-        )
-        async def _execute_cua_task_direct_tool(ctx: RunContextWrapper[AppContext], task_description: str) -> str:
-            """Tool wrapper for direct CUA task execution using persistent session."""
-            try:
-                # Create smart task from description
-                from core.cua_instructions import create_smart_cua_task_prompt
-                prompt, start_url, max_iterations = create_smart_cua_task_prompt(task_description, {})
-                
-                # Create CUA task
-                task = CuaTask(
-                    prompt=prompt,
-                    start_url=start_url,
-                    max_iterations=max_iterations
-                )
-                
-                # Execute using persistent session
-                result = await ctx.context.cua_session.run_task(task)
-                
-                # Log the action
-                await self._log_action_to_memory(
-                    action_type='cua_task_executed',
-                    result='SUCCESS' if 'SUCCESS' in result else 'COMPLETED',
-                    target=task_description,
-                    details={
-                        'prompt': prompt[:100],
-                        'start_url': start_url,
-                        'max_iterations': max_iterations,
-                        'result': result[:200]
-                    }
-                )
-                
-                return f"✅ CUA task completed: {result}"
-                
-            except Exception as e:
-                await self._log_action_to_memory(
-                    action_type='cua_task_failed',
-                    result='FAILED',
-                    target=task_description,
-                    details={'error': str(e)}
-                )
-                return f"❌ CUA task failed: {e}"
-
-        @function_tool(
-            name_override="read_timeline_with_session",
-            description_override="Read tweets from the home timeline using the persistent browser session. Specify number of tweets to read (default: 5).",
-        )
-        async def _read_timeline_with_session_tool(ctx: RunContextWrapper[AppContext], num_tweets: int = 5) -> str:
-            """Tool wrapper for reading timeline using persistent session."""
-            try:
-                from core.cua_instructions import get_timeline_reading_prompt
-                prompt = get_timeline_reading_prompt(num_tweets)
-                
-                task = CuaTask(
-                    prompt=prompt,
-                    start_url="https://x.com",
-                    max_iterations=30
-                )
-                
-                result = await ctx.context.cua_session.run_task(task)
-                
-                # Log the action
-                await self._log_action_to_memory(
-                    action_type='timeline_read',
-                    result='SUCCESS' if 'SUCCESS' in result else 'COMPLETED',
-                    target=f"read_{num_tweets}_tweets",
-                    details={'num_tweets': num_tweets, 'result': result[:200]}
-                )
-                
-                return f"📱 Timeline reading completed: {result}"
-                
-            except Exception as e:
-                await self._log_action_to_memory(
-                    action_type='timeline_read_failed',
-                    result='FAILED',
-                    target=f"read_{num_tweets}_tweets",
-                    details={'error': str(e)}
-                )
-                return f"❌ Timeline reading failed: {e}"
-
-        @function_tool(
-            name_override="search_and_engage_with_session",
-            description_override="Search X for topics and engage with relevant content using the persistent browser session. Provide a search query.",
-        )
-        async def _search_and_engage_with_session_tool(ctx: RunContextWrapper[AppContext], search_query: str) -> str:
-            """Tool wrapper for searching and engaging using persistent session."""
-            try:
-                from core.cua_instructions import get_search_and_like_tweet_prompt
-                prompt = get_search_and_like_tweet_prompt(search_query, max_iterations=25)
-                
-                task = CuaTask(
-                    prompt=prompt,
-                    start_url="https://x.com",
-                    max_iterations=25
-                )
-                
-                result = await ctx.context.cua_session.run_task(task)
-                
-                # Log the action
-                await self._log_action_to_memory(
-                    action_type='search_and_engage',
-                    result='SUCCESS' if 'SUCCESS' in result else 'COMPLETED',
-                    target=search_query,
-                    details={'search_query': search_query, 'result': result[:200]}
-                )
-                
-                return f"🔍 Search and engage completed: {result}"
-                
-            except Exception as e:
-                await self._log_action_to_memory(
-                    action_type='search_and_engage_failed',
-                    result='FAILED',
-                    target=search_query,
-                    details={'error': str(e)}
-                )
-                return f"❌ Search and engage failed: {e}"
-
-        # Add profile metrics tool
-        @function_tool(
-            name_override="get_profile_metrics",
-            description_override="Get AIified account statistics (followers, following, tweet count, listed count) via X API v2.",
-        )
-        async def _get_profile_metrics_tool(ctx: RunContextWrapper[AppContext]) -> str:
-            """Tool wrapper for fetching @AIified account metrics."""
-            try:
-                metrics = get_profile_metrics()
-                await self._log_action_to_memory(
-                    action_type="profile_metrics_snapshot",
-                    result="SUCCESS",
-                    details=metrics,
-                )
-                return json.dumps(metrics, indent=2)
-            except Exception as e:
-                await self._log_action_to_memory(
-                    action_type="profile_metrics_snapshot",
-                    result="FAILED",
-                    details={"error": str(e)},
-                )
-                return f"❌ Failed to fetch profile metrics: {e}"
-
-        # Add all the newly defined tools to the agent
-        self.tools.extend([
-            _enhanced_like_tweet_with_memory_tool,
-            _enhanced_research_with_memory_tool,
-            _get_unused_content_ideas_tool,
-            _check_recent_actions_tool,
-            _execute_cua_task_direct_tool,
-            _read_timeline_with_session_tool,
-            _search_and_engage_with_session_tool,
-            _get_profile_metrics_tool,
-        ])
-
-        # Add strategic direction tool for human guidance
-        self.tools.append(request_strategic_direction)
+            ),
+            _bind_tool(_enhanced_like_tweet_with_memory_tool, self),
+            _bind_tool(_enhanced_research_with_memory_tool, self),
+            _bind_tool(_get_unused_content_ideas_tool, self),
+            _bind_tool(_check_recent_actions_tool, self),
+            _bind_tool(_execute_cua_task_direct_tool, self),
+            _bind_tool(_read_timeline_with_session_tool, self),
+            _bind_tool(_search_and_engage_with_session_tool, self),
+            _bind_tool(_get_profile_metrics_tool, self),
+            # Strategic direction tool for human guidance
+            request_strategic_direction,
+        ]
 
     def run_simple_post_workflow(self, content: str) -> None:
         """Run a simple workflow that posts content to X via direct tool call."""
@@ -386,6 +693,10 @@ class OrchestratorAgent(Agent[AppContext]):
             self.logger.error("Workflow failed: %s", e)
             raise
 
+    async def arun_simple_post_workflow(self, content: str) -> None:
+        """Async run_simple_post_workflow: the blocking X API call runs in a worker thread."""
+        await asyncio.to_thread(self.run_simple_post_workflow, content)
+
     def research_topic_for_aiified(self, query: str) -> str:
         """
         Research AI/ML topics via ResearchAgent for content creation.
@@ -396,30 +707,24 @@ class OrchestratorAgent(Agent[AppContext]):
         Returns:
             String containing research results or failure message.
         """
-        self.logger.info(f"Orchestrator: Researching topic: {query}")
+        self.logger.info("Orchestrator: Researching topic: %s", query)
         
-        # The `input` to the ResearchAgent (which is a tool of the Orchestrator) 
-        # will be what the Orchestrator's LLM passes to the tool.
-        # We are directly invoking the research_agent here via Runner for simplicity in this test method.
-        
-        async def _internal_research():
-            # Note: The ResearchAgent itself uses WebSearchTool. 
-            # The Runner will handle the ResearchAgent's LLM calling WebSearchTool.
-            from agents import RunConfig
-            research_result = await Runner.run(
-                self.research_agent, 
-                input=query,
-                run_config=RunConfig(workflow_name="AIified_Topic_Research")
-            )
-            return str(research_result.final_output)
+        # Run on the shared background loop rather than a fresh asyncio.run() loop per call,
+        # so HTTP connection pools used by the Runner are kept between calls.
+        # _internal_research_with_params logs and returns a FAILED message on error.
+        return run_coroutine_sync(self._internal_research_with_params(query))
 
-        try:
-            result = asyncio.run(_internal_research())
-            self.logger.info(f"Orchestrator: Research result: {result}")
-            return result
-        except Exception as e:
-            self.logger.error(f"Orchestrator: Research failed: {e}", exc_info=True)
-            return f"FAILED: Research query '{query}' failed."
+    async def aresearch_topic_for_aiified(self, query: str) -> str:
+        """Async research_topic_for_aiified for callers already running on an event loop.
+        
+        Args:
+            query: The research query to search for AI/ML news or topics.
+        
+        Returns:
+            String containing research results or failure message.
+        """
+        self.logger.info("Orchestrator: Researching topic: %s", query)
+        return await self._internal_research_with_params(query)
 
     async def _internal_research_with_params(self, query: str) -> str:
         """Internal async research method that can be called from other async contexts.
@@ -430,22 +735,21 @@ class OrchestratorAgent(Agent[AppContext]):
         Returns:
             Research results as string
         """
-        self.logger.info(f"Orchestrator: Async researching topic: {query}")
+        self.logger.info("Orchestrator: Async researching topic: %s", query)
         
         try:
             # Note: The ResearchAgent itself uses WebSearchTool. 
             # The Runner will handle the ResearchAgent's LLM calling WebSearchTool.
-            from agents import Runner, RunConfig
             research_result = await Runner.run(
                 self.research_agent, 
                 input=query,
                 run_config=RunConfig(workflow_name="AIified_Topic_Research")
             )
             result = str(research_result.final_output)
-            self.logger.info(f"Orchestrator: Async research result: {result}")
+            self.logger.info("Orchestrator: Async research result: %s", result)
             return result
         except Exception as e:
-            self.logger.error(f"Orchestrator: Async research failed: {e}", exc_info=True)
+            self.logger.error("Orchestrator: Async research failed: %s", e, exc_info=True)
             return f"FAILED: Research query '{query}' failed."
 
     async def test_supabase_mcp_connection(self) -> list:
@@ -462,61 +766,50 @@ class OrchestratorAgent(Agent[AppContext]):
                 self.logger.info("Listing available tools...")
                 tools = await server.list_tools()
                 tool_names = [tool.name for tool in tools]
-                self.logger.info(f"✅ Successfully connected to Supabase MCP. Found {len(tool_names)} tools: {tool_names}")
+                self.logger.info(
+                    "✅ Successfully connected to Supabase MCP. Found %d tools: %s", len(tool_names), tool_names
+                )
                 return tool_names
         except Exception as e:
-            self.logger.error(f"❌ Failed to connect to Supabase MCP server: {e}", exc_info=True)
+            self.logger.error("❌ Failed to connect to Supabase MCP server: %s", e, exc_info=True)
             self.logger.error("Since the .env file is blocked by gitignore, I confirm that Node.js is installed and the SUPABASE_ACCESS_TOKEN is already set up in our .env file.")
             return []
 
     async def process_new_mentions_workflow(self) -> None:
         """Process new mentions workflow: fetch mentions, draft replies, and request human review."""
         self.logger.info("Starting process new mentions workflow.")
+        if _mentions_poll_backoff.should_skip():
+            self.logger.info(
+                "Skipping mentions fetch: last poll was empty (backoff %ss).", _mentions_poll_backoff.delay
+            )
+            return
         # Fetch last processed mention ID
-        since_id = get_agent_state("last_processed_mention_id_default_user")
+        since_id = _last_mention_id.get()
         try:
-            mentions_response = get_mentions(since_id=since_id)
+            mentions_response = await asyncio.to_thread(get_mentions, since_id=since_id)
         except (XApiError, OAuthError) as e:
             self.logger.error("Failed to fetch new mentions: %s", e)
             return
         mentions_data = mentions_response.get("data", [])
-        if not mentions_data:
-            self.logger.info("No new mentions found.")
-            return
         # Determine newest mention ID from meta or data
         newest_id = mentions_response.get("meta", {}).get("newest_id")
+        if not mentions_data or (since_id and newest_id == since_id):
+            self.logger.info("No new mentions found.")
+            _mentions_poll_backoff.record_empty()
+            return
+        _mentions_poll_backoff.reset()
         if not newest_id:
+            # Tweet IDs are numeric snowflakes; compare them as integers, not strings
             try:
-                newest_id = max(m.get("id") for m in mentions_data)
-            except Exception:
+                newest_id = str(max(int(m["id"]) for m in mentions_data if m.get("id")))
+            except ValueError:
                 newest_id = None
-        content_agent = self.content_creation_agent
-        for mention in mentions_data:
-            mention_text = mention.get("text", "")
-            mention_id = mention.get("id")
-            author_id = mention.get("author_id")
-            try:
-                drafted_dict = content_agent.draft_reply(
-                    original_tweet_text=mention_text,
-                    original_tweet_author=author_id,
-                    mention_tweet_id=mention_id,
-                )
-                # Convert the drafted reply dict into a Pydantic model for strict schema
-                try:
-                    handoff_data = DraftedReplyData(**drafted_dict)
-                except ValidationError as e_pydantic:
-                    self.logger.error(f"Failed to create DraftedReplyData for mention {mention_id}: {e_pydantic}")
-                    continue
-                review_result = call_request_human_review(
-                    task_type="reply_to_mention",
-                    data_for_review=handoff_data,
-                    reason="New mention reply drafted",
-                )
-                self.logger.info("Human review requested: %s", review_result)
-            except Exception as e:
-                self.logger.error("Failed to process mention %s: %s", mention_id, e)
+        await _bounded_gather(
+            (asyncio.to_thread(self._process_mention, mention) for mention in mentions_data),
+            settings.orchestrator_concurrency,
+        )
         if newest_id:
-            save_agent_state("last_processed_mention_id_default_user", newest_id)
+            _last_mention_id.save(newest_id)
         self.logger.info("Completed process new mentions workflow.")
 
     async def process_approved_replies_workflow(self) -> None:
@@ -530,26 +823,68 @@ class OrchestratorAgent(Agent[AppContext]):
         if not tasks:
             self.logger.info("No approved replies to process.")
             return
-        for task in tasks:
-            review_id = task.get("review_id")
-            data_json = task.get("data_for_review")
-            try:
-                data = json.loads(data_json)
-                text = data.get("draft_reply_text")
-                reply_to_id = data.get("original_mention_id")
-                result = _post_text_tweet(text=text, in_reply_to_tweet_id=reply_to_id)
-                self.logger.info("Posted reply for review_id %s: %s", review_id, result)
-                update_human_review_status(review_id, "posted_successfully")
-            except Exception as e:
-                self.logger.error("Failed to post reply for review_id %s: %s", review_id, e)
-                try:
-                    update_human_review_status(review_id, "failed_to_post")
-                except Exception as e2:
-                    self.logger.error(
-                        "Failed to update review status for review_id %s: %s", review_id, e2
-                    )
+        await _bounded_gather(
+            (asyncio.to_thread(self._post_approved_reply, task) for task in tasks),
+            settings.orchestrator_concurrency,
+        )
         self.logger.info("Completed process approved replies workflow.")
 
+    def _process_mention(self, mention: dict) -> None:
+        """Draft a reply to a single mention and submit it for human review."""
+        mention_text = mention.get("text", "")
+        mention_id = mention.get("id")
+        author_id = mention.get("author_id")
+        try:
+            drafted_dict = self.content_creation_agent.draft_reply(
+                original_tweet_text=mention_text,
+                original_tweet_author=author_id,
+                mention_tweet_id=mention_id,
+            )
+            # Convert the drafted reply dict into a Pydantic model for strict schema
+            try:
+                handoff_data = DraftedReplyData.model_validate(drafted_dict)
+            except ValidationError as e_pydantic:
+                self.logger.error("Failed to create DraftedReplyData for mention %s: %s", mention_id, e_pydantic)
+                return
+            review_result = call_request_human_review(
+                task_type="reply_to_mention",
+                data_for_review=handoff_data,
+                reason="New mention reply drafted",
+            )
+            self.logger.info("Human review requested: %s", review_result)
+        except Exception as e:
+            self.logger.error("Failed to process mention %s: %s", mention_id, e)
+
+    def _post_approved_reply(self, task: dict) -> None:
+        """Post a single human-approved reply and record the outcome on its review item."""
+        review_id = task.get("review_id")
+        data_json = task.get("data_for_review")
+        try:
+            # Parse the stored payload straight into the typed model (one pass, validated)
+            try:
+                reply = DraftedReplyData.model_validate_json(data_json)
+            except ValidationError as e_pydantic:
+                self.logger.error(
+                    "Failed to post reply for review_id %s: invalid review payload: %s",
+                    review_id,
+                    e_pydantic,
+                )
+                update_human_review_status(review_id, "failed_to_post")
+                return
+            result = _post_text_tweet(
+                text=reply.draft_reply_text, in_reply_to_tweet_id=reply.original_mention_id
+            )
+            self.logger.info("Posted reply for review_id %s: %s", review_id, result)
+            update_human_review_status(review_id, "posted_successfully")
+        except Exception as e:
+            self.logger.error("Failed to post reply for review_id %s: %s", review_id, e)
+            try:
+                update_human_review_status(review_id, "failed_to_post")
+            except Exception as e2:
+                self.logger.error(
+                    "Failed to update review status for review_id %s: %s", review_id, e2
+                )
+
     # ==================== MEMORY-DRIVEN DECISION TOOLS ====================
 
     async def _log_action_to_memory(
@@ -581,10 +916,252 @@ class OrchestratorAgent(Agent[AppContext]):
                     details=details,
                 )
         except Exception as e:
-            self.logger.error(f"Failed to log action to memory: {e}")
+            self.logger.error("Failed to log action to memory: %s", e)
             # Return a "failed" result but don't crash the main workflow
             return {"success": False, "error": str(e)}
 
+    def _log_action_in_background(
+        self,
+        action_type: str,
+        result: str,
+        target: str = None,
+        details: dict = None,
+        truncate: dict = None,
+    ) -> None:
+        """Queue an action log for the background writer instead of awaiting the memory store.
+        
+        Entries are dropped (with a warning) if the queue is full, so logging can never
+        stall the caller. Long string details named in `truncate` are only cut down by the
+        writer, so dropped entries never pay for the copy.
+        
+        Args:
+            action_type: Type of action (e.g., 'like_tweet', 'post_tweet', 'follow_user')
+            result: Result of the action ('SUCCESS', 'FAILED', 'IN_PROGRESS')
+            target: Target of the action (URL, username, query, etc.)
+            details: Additional metadata as JSON object
+            truncate: Optional mapping of details key to the maximum length stored
+        """
+        self._ensure_log_writer()
+        try:
+            self._log_queue.put_nowait(_ActionLogEntry(action_type, result, target, details, truncate))
+        except asyncio.QueueFull:
+            self.logger.warning("Action log queue full, dropping log for %s", action_type)
+
+    def _ensure_log_writer(self) -> None:
+        """Start the background log writer on the running event loop if it isn't running."""
+        if self._log_writer_task is not None and not self._log_writer_task.done():
+            if self._log_writer_task.get_loop() is asyncio.get_running_loop():
+                return
+        self._log_queue = asyncio.Queue(maxsize=ACTION_LOG_QUEUE_MAXSIZE)
+        self._log_writer_task = asyncio.create_task(self._log_writer(self._log_queue))
+
+    async def _log_writer(self, queue: asyncio.Queue) -> None:
+        """Drain queued action logs, writing up to ACTION_LOG_BATCH_SIZE entries per round-trip."""
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < ACTION_LOG_BATCH_SIZE:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            try:
+                await self._log_actions_bulk(batch)
+            except Exception:
+                # One bad batch must not stop the writer and strand the rest of the queue
+                self.logger.exception("Failed to write %d queued action logs", len(batch))
+            finally:
+                self._invalidate_tool_results("check_recent_actions")
+                for _ in batch:
+                    queue.task_done()
+
+    async def _log_actions_bulk(self, entries: list[_ActionLogEntry]) -> dict:
+        """Internal method to write a batch of action logs to strategic memory in one call.
+        
+        Uses a binary COPY over a direct Postgres pool when SUPABASE_POSTGRES_DSN is set and
+        asyncpg is installed, falling back to a bulk INSERT through the MCP server.
+        
+        Args:
+            entries: Queued action logs; each entry's truncate mapping is applied to its
+                details before writing
+            
+        Returns:
+            Dict containing the result of the memory operation
+        """
+        actions = []
+        for entry in entries:
+            details = entry.details
+            if entry.truncate and details:
+                # Truncate a copy: the caller may still hold the dict, and absent
+                # or non-string values are stored as they are
+                details = dict(details)
+                for key, max_length in entry.truncate.items():
+                    value = details.get(key)
+                    if isinstance(value, str):
+                        details[key] = value[:max_length]
+            actions.append(
+                {"action_type": entry.action_type, "result": entry.result, "target": entry.target, "details": details}
+            )
+        pool = await self._get_pg_pool()
+        if pool is not None:
+            try:
+                return await copy_actions_to_postgres(pool=pool, agent_name=self.name, actions=actions)
+            except Exception as e:
+                self.logger.warning("Direct Postgres action log failed, falling back to MCP: %s", e)
+        try:
+            async with self.supabase_mcp_server as server:
+                return await log_actions_to_memory_bulk(
+                    server=server,
+                    agent_name=self.name,
+                    actions=actions,
+                )
+        except Exception as e:
+            self.logger.error("Failed to bulk log %d actions to memory: %s", len(entries), e)
+            return {"success": False, "error": str(e)}
+
+    async def _get_pg_pool(self) -> Optional[Any]:
+        """Return the running loop's asyncpg pool, or None if direct Postgres logging is off."""
+        if asyncpg is None or not settings.supabase_postgres_dsn:
+            return None
+        loop = asyncio.get_running_loop()
+        if self._pg_pool is not None and self._pg_pool_loop is loop:
+            return self._pg_pool
+        if self._pg_pool is not None:
+            await self._close_pg_pool_on_loop(self._pg_pool, self._pg_pool_loop)
+            self._pg_pool = None
+            self._pg_pool_loop = None
+        if time.monotonic() < self._pg_pool_retry_at:
+            return None
+        try:
+            self._pg_pool = await asyncpg.create_pool(
+                settings.supabase_postgres_dsn,
+                min_size=1,
+                max_size=4,
+                timeout=PG_POOL_CONNECT_TIMEOUT_SECONDS,
+            )
+        except Exception as e:
+            self._pg_pool_retry_at = time.monotonic() + PG_POOL_RETRY_DELAY_SECONDS
+            self.logger.warning(
+                "Could not connect to Postgres for action logs, using MCP for %ds: %s",
+                PG_POOL_RETRY_DELAY_SECONDS, e,
+            )
+            return None
+        self._pg_pool_loop = loop
+        return self._pg_pool
+
+    async def _close_pg_pool_on_loop(self, pool: Any, loop: asyncio.AbstractEventLoop) -> None:
+        """Close a pool from a previous event loop on that loop, or drop it if the loop is gone."""
+        try:
+            if loop.is_closed() or not loop.is_running():
+                pool.terminate()
+            else:
+                await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(pool.close(), loop))
+        except Exception as e:
+            self.logger.error("Error closing Postgres pool from a previous event loop: %s", e)
+
+    async def flush_action_logs(self) -> None:
+        """Wait for queued action logs to be written and stop the background writer."""
+        if self._log_writer_task is None or self._log_writer_task.done():
+            return
+        await self._log_queue.join()
+        self._log_writer_task.cancel()
+        try:
+            await self._log_writer_task
+        except asyncio.CancelledError:
+            pass
+        self._log_writer_task = None
+
+    async def aclose(self) -> None:
+        """Flush queued action logs and release this event loop's Supabase connections.
+        
+        Call once the agent is done on the current event loop (e.g. at the end of a cycle).
+        """
+        try:
+            await self.flush_action_logs()
+        finally:
+            if self._pg_pool is not None:
+                if self._pg_pool_loop is asyncio.get_running_loop():
+                    await self._pg_pool.close()
+                else:
+                    await self._close_pg_pool_on_loop(self._pg_pool, self._pg_pool_loop)
+            self._pg_pool = None
+            self._pg_pool_loop = None
+            await self.supabase_mcp_server.aclose()
+
+    async def warm_up(self) -> None:
+        """Connect the shared Supabase MCP server ahead of the first memory call.
+        
+        The server stays connected until aclose(), so running this concurrently with
+        other startup work (e.g. launching the CUA browser) hides the npx cold start.
+        Failures are only logged; the first memory call will retry the connection.
+        """
+        try:
+            async with self.supabase_mcp_server:
+                pass
+        except Exception as e:
+            self.logger.warning("Could not warm up Supabase MCP server: %s", e)
+
+    async def _cached_tool_call(self, tool_name: str, args: tuple, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Return a recent result of a read-only tool called with the same arguments.
+        
+        The LLM often repeats a lookup within one run. Results are reused for
+        TOOL_RESULT_CACHE_TTL_SECONDS (failures are never cached), and
+        _invalidate_tool_results drops a tool's entries once the data it reads changes.
+        
+        Args:
+            tool_name: Name of the tool whose results are cached
+            args: Hashable tool arguments forming the cache key
+            call: Produces the result on a cache miss
+            
+        Returns:
+            The cached or freshly produced tool result
+        """
+        cache = self._tool_results.setdefault(tool_name, OrderedDict())
+        now = time.monotonic()
+        cached = cache.get(args)
+        if cached is not None and now - cached[0] < TOOL_RESULT_CACHE_TTL_SECONDS:
+            return cached[1]
+        result = await call()
+        if isinstance(result, dict):
+            succeeded = result.get("success", True)
+        else:
+            succeeded = bool(result) and not result.startswith(FAILED_PREFIX)
+        if succeeded:
+            # If the tool was invalidated meanwhile, `cache` is detached and this is dropped
+            cache.pop(args, None)
+            if len(cache) >= TOOL_RESULT_CACHE_MAX_ENTRIES:
+                cache.popitem(last=False)
+            cache[args] = (now, result)
+        return result
+
+    def _invalidate_tool_results(self, tool_name: str) -> None:
+        """Forget cached results of a tool after the data it reads has changed."""
+        self._tool_results.pop(tool_name, None)
+
+    async def _call_memory_tool(
+        self,
+        tool: Callable[..., Awaitable[dict]],
+        failure: str,
+        on_error: Callable[[Exception], dict],
+        **kwargs: Any,
+    ) -> dict:
+        """Run a memory tool against the shared Supabase MCP server.
+        
+        Args:
+            tool: Memory tool coroutine function taking a `server` keyword argument
+            failure: What failed, for the error log (e.g. "mark content idea as used")
+            on_error: Builds the result returned when the tool raises
+            **kwargs: Arguments passed on to the tool
+            
+        Returns:
+            The tool's result, or on_error(exception) if it failed
+        """
+        try:
+            async with self.supabase_mcp_server as server:
+                return await tool(server=server, **kwargs)
+        except Exception as e:
+            self.logger.error("Failed to %s: %s", failure, e)
+            return on_error(e)
+
     async def _retrieve_recent_actions_from_memory(
         self,
         action_type: str = None,
@@ -601,17 +1178,14 @@ class OrchestratorAgent(Agent[AppContext]):
         Returns:
             Dict containing the list of recent actions and metadata
         """
-        try:
-            async with self.supabase_mcp_server as server:
-                return await retrieve_recent_actions_from_memory(
-                    server=server,
-                    action_type=action_type,
-                    hours_back=hours_back,
-                    limit=limit,
-                )
-        except Exception as e:
-            self.logger.error(f"Failed to retrieve recent actions from memory: {e}")
-            return {"success": False, "actions": [], "count": 0, "error": str(e)}
+        return await self._call_memory_tool(
+            retrieve_recent_actions_from_memory,
+            "retrieve recent actions from memory",
+            lambda e: {"success": False, "actions": [], "count": 0, "error": str(e)},
+            action_type=action_type,
+            hours_back=hours_back,
+            limit=limit,
+        )
 
     async def _save_content_idea_to_memory(
         self,
@@ -633,9 +1207,12 @@ class OrchestratorAgent(Agent[AppContext]):
         Returns:
             Dict containing the result of the memory operation
         """
+        dedup_key = source_url or idea_summary
+        if dedup_key in _seen_content_ideas:
+            return {"success": True, "deduped": True}
         try:
             async with self.supabase_mcp_server as server:
-                return await save_content_idea_to_memory(
+                result = await save_content_idea_to_memory(
                     server=server,
                     idea_summary=idea_summary,
                     source_url=source_url,
@@ -643,8 +1220,44 @@ class OrchestratorAgent(Agent[AppContext]):
                     topic_category=topic_category,
                     relevance_score=relevance_score,
                 )
+            _remember_content_idea(dedup_key)
+            self._invalidate_tool_results("get_unused_content_ideas")
+            return result
+        except Exception as e:
+            self.logger.error("Failed to save content idea to memory: %s", e)
+            return {"success": False, "error": str(e)}
+
+    async def _save_content_ideas_bulk(self, ideas: list[dict]) -> dict:
+        """Internal method to save several content ideas to strategic memory in one call.
+        
+        Ideas already saved by this process (or repeated within the batch) are skipped here;
+        the INSERT skips any other idea already stored.
+        
+        Args:
+            ideas: Idea dicts with the same keys as _save_content_idea_to_memory's arguments
+            
+        Returns:
+            Dict containing the result of the memory operation
+        """
+        new_ideas = {}
+        for idea in ideas:
+            dedup_key = idea.get('source_url') or idea['idea_summary']
+            if dedup_key not in _seen_content_ideas:
+                new_ideas.setdefault(dedup_key, idea)
+        if not new_ideas:
+            return {"success": True, "deduped": True, "count": 0}
+        try:
+            async with self.supabase_mcp_server as server:
+                result = await save_content_ideas_to_memory_bulk(
+                    server=server,
+                    ideas=list(new_ideas.values()),
+                )
+            for dedup_key in new_ideas:
+                _remember_content_idea(dedup_key)
+            self._invalidate_tool_results("get_unused_content_ideas")
+            return result
         except Exception as e:
-            self.logger.error(f"Failed to save content idea to memory: {e}")
+            self.logger.error("Failed to bulk save %d content ideas to memory: %s", len(ideas), e)
             return {"success": False, "error": str(e)}
 
     async def _get_unused_content_ideas_from_memory(
@@ -661,16 +1274,13 @@ class OrchestratorAgent(Agent[AppContext]):
         Returns:
             Dict containing the list of unused content ideas
         """
-        try:
-            async with self.supabase_mcp_server as server:
-                return await get_unused_content_ideas_from_memory(
-                    server=server,
-                    topic_category=topic_category,
-                    limit=limit,
-                )
-        except Exception as e:
-            self.logger.error(f"Failed to retrieve unused content ideas from memory: {e}")
-            return {"success": False, "ideas": [], "count": 0, "error": str(e)}
+        return await self._call_memory_tool(
+            get_unused_content_ideas_from_memory,
+            "retrieve unused content ideas from memory",
+            lambda e: {"success": False, "ideas": [], "count": 0, "error": str(e)},
+            topic_category=topic_category,
+            limit=limit,
+        )
 
     async def _mark_content_idea_as_used(self, idea_id: int) -> dict:
         """Internal method to mark a content idea as used.
@@ -682,42 +1292,35 @@ class OrchestratorAgent(Agent[AppContext]):
             Dict containing the result of the memory operation
         """
         try:
-            async with self.supabase_mcp_server as server:
-                return await mark_content_idea_as_used(
-                    server=server,
-                    idea_id=idea_id,
-                )
-        except Exception as e:
-            self.logger.error(f"Failed to mark content idea as used: {e}")
-            return {"success": False, "error": str(e)}
+            return await self._call_memory_tool(
+                mark_content_idea_as_used,
+                "mark content idea as used",
+                lambda e: {"success": False, "error": str(e)},
+                idea_id=idea_id,
+            )
+        finally:
+            self._invalidate_tool_results("get_unused_content_ideas")
 
     async def _check_recent_target_interactions(
         self,
         target: str,
-        action_types: list = None,
+        action_types: Optional[Sequence[str]] = None,
         hours_back: int = 24,
     ) -> dict:
         """Internal method to check recent interactions with a target.
         
         Args:
             target: The target to check (URL, username, etc.)
-            action_types: List of action types to check (optional)
+            action_types: Action types to check, e.g. a shared tuple (optional)
             hours_back: How many hours back to look (default: 24)
             
         Returns:
             Dict containing interaction history and spam prevention recommendations
         """
-        try:
-            async with self.supabase_mcp_server as server:
-                return await check_recent_target_interactions(
-                    server=server,
-                    target=target,
-                    action_types=action_types,
-                    hours_back=hours_back,
-                )
-        except Exception as e:
-            self.logger.error(f"Failed to check recent target interactions: {e}")
-            return {
+        return await self._call_memory_tool(
+            check_recent_target_interactions,
+            "check recent target interactions",
+            lambda e: {
                 "success": False,
                 "target": target,
                 "interactions": [],
@@ -725,7 +1328,55 @@ class OrchestratorAgent(Agent[AppContext]):
                 "should_skip": False,
                 "reason": f"Memory check failed: {e}",
                 "error": str(e)
-            }
+            },
+            target=target,
+            action_types=action_types,
+            hours_back=hours_back,
+        )
+
+    async def _check_recent_cached(
+        self,
+        target: str,
+        action_types: Optional[Sequence[str]] = None,
+        hours_back: int = 24,
+    ) -> dict:
+        """Memoized _check_recent_target_interactions for bursty requests on the same target.
+        
+        "Skip" verdicts are reused for settings.memory_check_cache_ttl_seconds (recorded interactions
+        don't disappear, whereas a "safe" verdict is invalidated by the action it permits).
+        The cache holds at most MEMORY_CHECK_CACHE_MAX_ENTRIES entries, evicting the oldest first.
+        
+        Args:
+            target: The target to check (URL, username, etc.)
+            action_types: Action types to check, e.g. a shared tuple (optional)
+            hours_back: How many hours back to look (default: 24)
+            
+        Returns:
+            Dict containing interaction history and spam prevention recommendations
+        """
+        key = (target, tuple(sorted(action_types or ())), hours_back)
+        now = time.monotonic()
+        cached = self._memcheck_cache.get(key)
+        if cached is not None and now - cached[0] < settings.memory_check_cache_ttl_seconds:
+            return cached[1]
+        async with self._memory_check_semaphore():
+            result = await self._check_recent_target_interactions(
+                target=target, action_types=action_types, hours_back=hours_back
+            )
+        if result.get("success") and result.get("should_skip"):
+            self._memcheck_cache.pop(key, None)
+            if len(self._memcheck_cache) >= MEMORY_CHECK_CACHE_MAX_ENTRIES:
+                self._memcheck_cache.popitem(last=False)
+            self._memcheck_cache[key] = (now, result)
+        return result
+
+    def _memory_check_semaphore(self) -> asyncio.Semaphore:
+        """Return the running loop's semaphore bounding concurrent memory-backend checks."""
+        loop = asyncio.get_running_loop()
+        if self._memcheck_semaphore_loop is not loop:
+            self._memcheck_semaphore = asyncio.Semaphore(settings.memory_check_concurrency)
+            self._memcheck_semaphore_loop = loop
+        return self._memcheck_semaphore
 
     # ==================== ENHANCED METHODS WITH MEMORY ====================
 
@@ -739,98 +1390,59 @@ class OrchestratorAgent(Agent[AppContext]):
             CuaTask object if proceeding with like, or string message if skipping
         """
         # Determine if this is a specific URL or a search query
-        is_search_query = not tweet_url.startswith('http')
+        kind, normalized_target = _classify_target(tweet_url)
+        mode = _LIKE_MODES[kind]
+        target_for_memory = mode.memory_target(normalized_target)
         
-        if is_search_query:
-            # This is a search query, not a specific tweet URL
-            search_query = tweet_url
-            target_for_memory = f"search_and_like:{search_query}"
-            
-            # Check if we've recently done a search-and-like for this query
-            memory_check = await self._check_recent_target_interactions(
-                target=target_for_memory,
-                action_types=['search_and_like', 'like_tweet'],
-                hours_back=2  # Shorter window for search queries
-            )
-            
-            if memory_check.get('should_skip', False):
-                result_msg = f"⏭️ Skipping search-and-like for '{search_query}' - {memory_check.get('reason', 'Recent similar action detected')}"
-                self.logger.info(result_msg)
-                
-                # Log the skipped action to memory
-                await self._log_action_to_memory(
-                    action_type='search_and_like_skipped',
-                    result='SKIPPED',
-                    target=target_for_memory,
-                    details={'reason': memory_check.get('reason'), 'search_query': search_query}
-                )
-                
-                return result_msg
-            
-            # Generate comprehensive search-and-like prompt
-            from core.cua_instructions import get_search_and_like_tweet_prompt
-            prompt = get_search_and_like_tweet_prompt(search_query, max_iterations=25)
-            
-            # Create the CuaTask object for search-and-like
-            task = CuaTask(
-                prompt=prompt,
-                start_url="https://x.com",  # Start from X.com home page
-                max_iterations=25  # More iterations needed for search-and-like
+        # Check if we've recently interacted with this target
+        memory_check = await self._check_recent_cached(
+            target=target_for_memory,
+            action_types=mode.action_types,
+            hours_back=mode.hours_back,
+        )
+        
+        if memory_check.get('should_skip', False):
+            reason = memory_check.get('reason')
+            result_msg = mode.skip_message.format(
+                target=tweet_url, reason=reason or mode.default_reason
             )
+            self.logger.info(result_msg)
             
-            # Log the task creation to memory
-            await self._log_action_to_memory(
-                action_type='search_and_like_task_created',
-                result='TASK_CREATED',
+            # Log the skipped action to memory
+            details = {'reason': reason, 'interaction_count': memory_check.get('interaction_count')}
+            if kind == 'query':
+                details['search_query'] = tweet_url
+            self._log_action_in_background(
+                action_type=f'{mode.log_prefix}_skipped',
+                result='SKIPPED',
                 target=target_for_memory,
-                details={'search_query': search_query, 'max_iterations': task.max_iterations}
+                details=details,
             )
             
-            self.logger.info(f"✅ Memory check passed - created search-and-like CUA task for: {search_query}")
-            return task
-            
-        else:
-            # This is a specific tweet URL - use the original logic
-            memory_check = await self._check_recent_target_interactions(
-                target=tweet_url,
-                action_types=['like_tweet', 'reply_to_tweet'],
-                hours_back=24
-            )
-            
-            if memory_check.get('should_skip', False):
-                result_msg = f"⏭️ Skipping tweet like - {memory_check.get('reason', 'Recent interaction detected')}"
-                self.logger.info(result_msg)
-                
-                # Log the skipped action to memory
-                await self._log_action_to_memory(
-                    action_type='like_tweet_skipped',
-                    result='SKIPPED',
-                    target=tweet_url,
-                    details={'reason': memory_check.get('reason'), 'interaction_count': memory_check.get('interaction_count')}
-                )
-                
-                return result_msg
-            
-            # Generate the prompt for liking using the CUA instructions
-            prompt = get_tweet_like_prompt(tweet_url)
-            
-            # Create the CuaTask object
-            task = CuaTask(
-                prompt=prompt,
-                start_url=tweet_url,
-                max_iterations=20  # Reasonable default for like operations
-            )
-            
-            # Log the task creation to memory
-            await self._log_action_to_memory(
-                action_type='like_tweet_task_created',
-                result='TASK_CREATED',
-                target=tweet_url,
-                details={'task_prompt': prompt[:100], 'max_iterations': task.max_iterations}
-            )
-            
-            self.logger.info(f"✅ Memory check passed - creating CUA task for tweet like: {tweet_url}")
-            return task
+            return result_msg
+        
+        # Generate the prompt and create the CuaTask object
+        prompt = mode.prompt(tweet_url)
+        task = CuaTask(
+            prompt=prompt,
+            start_url=mode.start_url(tweet_url),
+            max_iterations=mode.max_iterations,
+        )
+        
+        # Log the task creation to memory
+        details = {'task_prompt': prompt, 'max_iterations': task.max_iterations}
+        if kind == 'query':
+            details['search_query'] = tweet_url
+        self._log_action_in_background(
+            action_type=f'{mode.log_prefix}_task_created',
+            result='TASK_CREATED',
+            target=target_for_memory,
+            details=details,
+            truncate={'task_prompt': 100},
+        )
+        
+        self.logger.info("✅ Memory check passed - created %s CUA task for: %s", mode.log_prefix, tweet_url)
+        return task
 
     async def _enhanced_research_with_memory(self, query: str) -> str:
         """Enhanced research with automatic content idea saving.
@@ -841,38 +1453,41 @@ class OrchestratorAgent(Agent[AppContext]):
         Returns:
             Research results with content ideas saved to memory
         """
-        self.logger.info(f"🔍 Starting enhanced research with memory: {query}")
+        self.logger.info("🔍 Starting enhanced research with memory: %s", query)
         
         # Perform the research using async method
         research_result = await self._internal_research_with_params(query)
         
+        result_length = len(research_result) if research_result else 0
+        
         # Log the research action
-        await self._log_action_to_memory(
+        self._log_action_in_background(
             action_type='research_topic',
-            result='SUCCESS' if research_result else 'FAILED',
+            result='SUCCESS' if result_length else 'FAILED',
             target=query,
-            details={'query': query, 'result_length': len(research_result) if research_result else 0}
+            details={'query': query, 'result_length': result_length}
         )
         
         # Extract and save potential content ideas from research results
-        if research_result and len(research_result) > 100:  # Only if substantial content
+        if result_length > 100:  # Only if substantial content
             # Simple extraction: split by sentences and find interesting ones
-            sentences = research_result.split('. ')
-            for sentence in sentences:
+            ideas = []
+            for match in _SENTENCE_RE.finditer(research_result):
+                sentence = match.group()
                 # Look for sentences that might be good content ideas
-                if (len(sentence) > 50 and len(sentence) < 200 and 
-                    any(keyword in sentence.lower() for keyword in ['ai', 'ml', 'artificial intelligence', 'machine learning', 'llm', 'model', 'data'])):
-                    
-                    await self._save_content_idea_to_memory(
-                        idea_summary=sentence.strip(),
-                        source_query=query,
-                        topic_category='AI/ML',
-                        relevance_score=7  # Default relevance score
-                    )
+                if _is_idea_sentence(sentence):
+                    ideas.append({
+                        'idea_summary': sentence.strip(),
+                        'source_query': query,
+                        'topic_category': 'AI/ML',
+                        'relevance_score': 7,  # Default relevance score
+                    })
+            if ideas:
+                await self._save_content_ideas_bulk(ideas)
         
         return research_result
 
-    async def _create_smart_cua_task(self, task_description: str, context: dict = None) -> str:
+    async def _create_smart_cua_task(self, task_description: str, context: dict = None) -> SmartCuaTaskHandoff:
         """Create an intelligently structured CUA task with optimized prompts.
         
         Args:
@@ -880,18 +1495,14 @@ class OrchestratorAgent(Agent[AppContext]):
             context: Optional context dict with additional parameters
             
         Returns:
-            String message about task creation or execution instructions
+            SmartCuaTaskHandoff with the prompt, start URL and iteration budget for
+            execute_cua_task, or with ok=False and the error if creation failed
         """
-        self.logger.info(f"🧠 Creating smart CUA task: {task_description}")
+        self.logger.info("🧠 Creating smart CUA task: %s", task_description)
         
         try:
-            # Import the smart prompt generator
-            from core.cua_instructions import create_smart_cua_task_prompt
-            
             # Generate optimized prompt and parameters
-            prompt, start_url, max_iterations = create_smart_cua_task_prompt(
-                task_description, context or {}
-            )
+            prompt, start_url, max_iterations = _smart_cua_task_prompt(task_description, context)
             
             # Create the CuaTask object
             task = CuaTask(
@@ -901,7 +1512,7 @@ class OrchestratorAgent(Agent[AppContext]):
             )
             
             # Log the task creation to memory
-            await self._log_action_to_memory(
+            self._log_action_in_background(
                 action_type='smart_cua_task_created',
                 result='TASK_CREATED',
                 target=task_description,
@@ -912,13 +1523,17 @@ class OrchestratorAgent(Agent[AppContext]):
                 }
             )
             
-            self.logger.info(f"✅ Smart CUA task created: {max_iterations} iterations, starting at {start_url}")
+            self.logger.info(
+                "✅ Smart CUA task created: %d iterations, starting at %s", max_iterations, start_url
+            )
             
-            # Return instructions for handoff
-            return f"Smart CUA task ready for execution. Use execute_cua_task with prompt='{prompt[:100]}...', start_url='{start_url}', max_iterations={max_iterations}"
+            return SmartCuaTaskHandoff(
+                prompt=task.prompt, start_url=task.start_url, max_iterations=task.max_iterations
+            )
             
         except Exception as e:
-            self.logger.error(f"Failed to create smart CUA task: {e}", exc_info=True)
-            return f"FAILED: Could not create CUA task - {str(e)}"
+            self.logger.error("Failed to create smart CUA task: %s", e)
+            self.logger.debug("Smart CUA task creation traceback", exc_info=True)
+            return SmartCuaTaskHandoff(prompt='', start_url='', max_iterations=0, ok=False, error=str(e))
 
     # ==================== END MEMORY TOOLS ====================
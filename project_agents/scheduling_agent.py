@@ -1,6 +1,7 @@
 """Scheduling agent to schedule orchestrator workflows."""
 
 import asyncio
+import functools
 import logging
 
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -10,7 +11,9 @@ from agents import (
     Agent,  # Import Agent from SDK
     Runner,
 )
+from project_agents.computer_use_agent import ComputerUseAgent
 from project_agents.orchestrator_agent import OrchestratorAgent
+from core.background_loop import run_coroutine_sync
 from core.cua_session_manager import CuaSessionManager
 
 logger = logging.getLogger(__name__)
@@ -20,28 +23,39 @@ class AppContext:
     """Application context containing the persistent CUA session."""
     cua_session: CuaSessionManager
 
+@functools.lru_cache(maxsize=1)
+def _get_computer_use_agent() -> ComputerUseAgent:
+    """Return the process-wide ComputerUseAgent whose browser session stays warm between cycles."""
+    return ComputerUseAgent()
+
+
 async def _run_cycle_with_session() -> None:
     """Run the autonomous cycle with a persistent CUA session."""
     logger.info("Starting autonomous cycle with persistent CUA session...")
     
     try:
-        async with CuaSessionManager() as cua_session:
-            logger.info("CUA session established, initializing orchestrator...")
-            
-            # Create the application context with the live session
-            context = AppContext(cua_session=cua_session)
-            
-            # Create orchestrator agent
-            orchestrator = OrchestratorAgent()
-            
-            # Run the orchestrator with the context containing the persistent session
-            await Runner.run(
-                orchestrator, 
-                input="New action cycle: Assess the situation and choose a strategic action based on your goals.",
-                context=context
-            )
-            
-            logger.info("Autonomous cycle completed successfully with persistent CUA session")
+        orchestrator = OrchestratorAgent()
+        # Start the Supabase MCP server (npx cold start) while the browser launches
+        warm_up = asyncio.create_task(orchestrator.warm_up())
+        try:
+            async with _get_computer_use_agent().session() as cua_session:
+                logger.info("CUA session established, running orchestrator...")
+                await warm_up
+                
+                # Create the application context with the live session
+                context = AppContext(cua_session=cua_session)
+                
+                # Run the orchestrator with the context containing the persistent session
+                await Runner.run(
+                    orchestrator, 
+                    input="New action cycle: Assess the situation and choose a strategic action based on your goals.",
+                    context=context
+                )
+        finally:
+            await warm_up
+            await orchestrator.aclose()
+        
+        logger.info("Autonomous cycle completed successfully with persistent CUA session")
     except Exception as e:
         logger.error(f"Error in autonomous cycle with CUA session: {e}", exc_info=True)
 
@@ -50,11 +64,25 @@ def run_autonomous_cycle_job() -> None:
     """Runs the Orchestrator's main autonomous decision-making cycle with persistent CUA session."""
     logger.info("Scheduler triggering autonomous action cycle with persistent CUA session...")
     try:
-        # Run the new async function with CUA session management
-        asyncio.run(_run_cycle_with_session())
+        # Run on the persistent background loop so per-loop clients (e.g. the CUA
+        # workflow's AsyncOpenAI connection pool) stay warm between cycles
+        run_coroutine_sync(_run_cycle_with_session())
     except Exception as e:
         logger.error("Error running autonomous orchestrator cycle with CUA session: %s", e)
 
+
+def shutdown_autonomous_cycle() -> None:
+    """Stop the warm CUA browser session kept between scheduled cycles.
+
+    Call after the scheduler has shut down so no cycle is still using it.
+    """
+    if _get_computer_use_agent.cache_info().currsize == 0:
+        return
+    try:
+        run_coroutine_sync(_get_computer_use_agent().aclose())
+    except Exception as e:
+        logger.error("Error stopping the CUA browser session: %s", e)
+
 class SchedulingAgent(Agent):
     """Agent responsible for scheduling the OrchestratorAgent workflows."""
 
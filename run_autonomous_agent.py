@@ -26,7 +26,7 @@ logging.basicConfig(
 )
 
 from core.scheduler_setup import initialize_scheduler
-from project_agents.scheduling_agent import SchedulingAgent
+from project_agents.scheduling_agent import SchedulingAgent, shutdown_autonomous_cycle
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +75,7 @@ def main() -> None:
         except (KeyboardInterrupt, SystemExit):
             logger.info("\n🛑 Shutdown signal received. Shutting down scheduler...")
             scheduler.shutdown()
+            shutdown_autonomous_cycle()
             logger.info("✅ Scheduler shut down successfully. Exiting.")
             logger.info("👋 Autonomous X Agentic Unit 'AIified' stopped.")
     
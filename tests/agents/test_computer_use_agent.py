@@ -0,0 +1,61 @@
+import pytest
+
+pytest.importorskip("playwright")
+
+from project_agents import computer_use_agent  # noqa: E402
+from project_agents.computer_use_agent import ComputerUseAgent  # noqa: E402
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeSession:
+    instances: list["FakeSession"] = []
+
+    def __init__(self):
+        self.connected = False
+        self.exited = False
+        FakeSession.instances.append(self)
+
+    @property
+    def is_active(self):
+        return self.connected
+
+    async def __aenter__(self):
+        self.connected = True
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.connected = False
+        self.exited = True
+
+
+@pytest.fixture(autouse=True)
+def fake_session(monkeypatch):
+    FakeSession.instances = []
+    monkeypatch.setattr(computer_use_agent, "CuaSessionManager", FakeSession)
+
+
+async def test_warm_session_is_reused_between_holders():
+    agent = ComputerUseAgent()
+
+    async with agent.session() as first:
+        pass
+    async with agent.session() as second:
+        assert second is first
+    assert len(FakeSession.instances) == 1
+    await agent.aclose()
+    assert first.exited
+
+
+async def test_disconnected_browser_is_closed_and_relaunched():
+    agent = ComputerUseAgent()
+
+    async with agent.session() as crashed:
+        pass
+    crashed.connected = False  # e.g. Chromium crashed between cycles
+
+    async with agent.session() as relaunched:
+        assert relaunched is not crashed
+        assert relaunched.is_active
+    assert crashed.exited
+    await agent.aclose()
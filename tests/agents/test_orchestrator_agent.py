@@ -1,7 +1,9 @@
+import asyncio
 import logging
 
 import pytest
 
+from core.constants import PG_POOL_RETRY_DELAY_SECONDS
 from project_agents.orchestrator_agent import OrchestratorAgent
 from tools.human_handoff_tool import DraftedReplyData
 from tools.x_api_tools import XApiError
@@ -9,6 +11,20 @@ from tools.x_api_tools import XApiError
 pytestmark = pytest.mark.asyncio
 
 
+@pytest.fixture(autouse=True)
+def reset_process_wide_state():
+    """Module-level caches outlive each OrchestratorAgent, so reset them between tests."""
+    from project_agents import orchestrator_agent
+
+    orchestrator_agent._mentions_poll_backoff.reset()
+    orchestrator_agent._last_mention_id.invalidate()
+    orchestrator_agent._seen_content_ideas.clear()
+    yield
+    orchestrator_agent._mentions_poll_backoff.reset()
+    orchestrator_agent._last_mention_id.invalidate()
+    orchestrator_agent._seen_content_ideas.clear()
+
+
 async def test_no_new_mentions(mocker, caplog):
     # No mentions returned -> should not process or save state
     mocker.patch("agents.orchestrator_agent.get_agent_state", return_value="42")
@@ -215,7 +231,7 @@ async def test_newest_id_without_meta(mocker):
     orchestrator = OrchestratorAgent()
     await orchestrator.process_new_mentions_workflow()
 
-    # lexicographically max among '1','3','2' is '3'
+    # numerically max among '1','3','2' is '3'
     mock_save.assert_called_once_with("last_processed_mention_id_default_user", "3")
 
 
@@ -245,8 +261,8 @@ async def test_no_approved_replies(mocker, caplog):
 async def test_successful_approved_replies(mocker):
     """Should post approved replies and update status successfully."""
     tasks = [
-        {"review_id": 1, "data_for_review": '{"draft_reply_text":"r1","original_mention_id":"m1"}'},
-        {"review_id": 2, "data_for_review": '{"draft_reply_text":"r2","original_mention_id":"m2"}'},
+        {"review_id": 1, "data_for_review": '{"draft_reply_text":"r1","original_mention_id":"m1","status":"approved"}'},
+        {"review_id": 2, "data_for_review": '{"draft_reply_text":"r2","original_mention_id":"m2","status":"approved"}'},
     ]
     mocker.patch("agents.orchestrator_agent.get_approved_reply_tasks", return_value=tasks)
     mock_post = mocker.patch("agents.orchestrator_agent._post_text_tweet", return_value={})
@@ -276,7 +292,7 @@ async def test_failed_post_updates_status_failed_to_post(mocker, caplog):
     tasks = [
         {
             "review_id": 10,
-            "data_for_review": '{"draft_reply_text":"fail","original_mention_id":"m10"}',
+            "data_for_review": '{"draft_reply_text":"fail","original_mention_id":"m10","status":"approved"}',
         }
     ]
     mocker.patch("agents.orchestrator_agent.get_approved_reply_tasks", return_value=tasks)
@@ -330,3 +346,470 @@ def test_process_approved_replies_tool_registered():
     orchestrator = OrchestratorAgent()
     tool_names = [getattr(tool, "name", None) for tool in orchestrator.tools]
     assert "process_approved_replies" in tool_names
+
+
+# Tests for background action logging
+async def test_background_action_logs_are_batched(mocker):
+    """Queued action logs should be written in batches and flushed on demand."""
+    mock_bulk = mocker.patch(
+        "project_agents.orchestrator_agent.log_actions_to_memory_bulk",
+        return_value={"success": True},
+    )
+    orchestrator = OrchestratorAgent()
+    orchestrator.supabase_mcp_server = mocker.MagicMock()
+    orchestrator.supabase_mcp_server.__aenter__ = mocker.AsyncMock(return_value="server")
+    orchestrator.supabase_mcp_server.__aexit__ = mocker.AsyncMock(return_value=None)
+
+    for i in range(3):
+        orchestrator._log_action_in_background("like_tweet", "SUCCESS", target=f"t{i}")
+    await orchestrator.flush_action_logs()
+
+    mock_bulk.assert_called_once()
+    actions = mock_bulk.call_args.kwargs["actions"]
+    assert [a["target"] for a in actions] == ["t0", "t1", "t2"]
+
+
+async def test_background_action_log_details_truncated_by_writer(mocker):
+    """Details named in `truncate` are shortened when the batch is written."""
+    mock_bulk = mocker.patch(
+        "project_agents.orchestrator_agent.log_actions_to_memory_bulk",
+        return_value={"success": True},
+    )
+    orchestrator = OrchestratorAgent()
+    orchestrator.supabase_mcp_server = mocker.MagicMock()
+    orchestrator.supabase_mcp_server.__aenter__ = mocker.AsyncMock(return_value="server")
+    orchestrator.supabase_mcp_server.__aexit__ = mocker.AsyncMock(return_value=None)
+
+    orchestrator._log_action_in_background(
+        "like_tweet_task_created",
+        "TASK_CREATED",
+        details={"task_prompt": "x" * 500, "max_iterations": 20},
+        truncate={"task_prompt": 100},
+    )
+    await orchestrator.flush_action_logs()
+
+    details = mock_bulk.call_args.kwargs["actions"][0]["details"]
+    assert details == {"task_prompt": "x" * 100, "max_iterations": 20}
+
+
+async def test_background_action_log_truncation_copies_and_skips_non_strings(mocker):
+    """Truncation leaves the caller's dict alone and ignores missing or non-string values."""
+    mock_bulk = mocker.patch(
+        "project_agents.orchestrator_agent.log_actions_to_memory_bulk",
+        return_value={"success": True},
+    )
+    orchestrator = OrchestratorAgent()
+    orchestrator.supabase_mcp_server = mocker.MagicMock()
+    orchestrator.supabase_mcp_server.__aenter__ = mocker.AsyncMock(return_value="server")
+    orchestrator.supabase_mcp_server.__aexit__ = mocker.AsyncMock(return_value=None)
+
+    original = {"result": "y" * 300, "error": None}
+    orchestrator._log_action_in_background(
+        "timeline_read",
+        "SUCCESS",
+        details=original,
+        truncate={"result": 200, "error": 50, "missing": 10},
+    )
+    await orchestrator.flush_action_logs()
+
+    details = mock_bulk.call_args.kwargs["actions"][0]["details"]
+    assert details == {"result": "y" * 200, "error": None}
+    assert original == {"result": "y" * 300, "error": None}
+
+
+async def test_background_log_writer_survives_a_failed_batch(mocker, caplog):
+    """A batch that fails to write is logged and later batches are still written."""
+    from core.constants import ACTION_LOG_BATCH_SIZE
+
+    orchestrator = OrchestratorAgent()
+    write = mocker.patch.object(
+        orchestrator, "_log_actions_bulk", mocker.AsyncMock(side_effect=[RuntimeError("bad batch"), {"success": True}])
+    )
+
+    for i in range(ACTION_LOG_BATCH_SIZE + 1):
+        orchestrator._log_action_in_background("like_tweet", "SUCCESS", target=f"t{i}")
+    caplog.set_level(logging.ERROR)
+    await asyncio.wait_for(orchestrator.flush_action_logs(), timeout=1)
+
+    assert write.await_count == 2
+    second_batch = write.call_args_list[1].args[0]
+    assert [entry.target for entry in second_batch] == [f"t{ACTION_LOG_BATCH_SIZE}"]
+    assert "Failed to write" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "target, memory_target, start_url, max_iterations",
+    [
+        ("https://x.com/user/status/1", "https://x.com/user/status/1", "https://x.com/user/status/1", 20),
+        ("  #AI ", "search_and_like:#ai", "https://x.com", 25),
+    ],
+)
+async def test_like_creates_task_for_url_and_query(mocker, target, memory_target, start_url, max_iterations):
+    """URLs and search queries share one flow, driven by their like mode."""
+    orchestrator = OrchestratorAgent()
+    check = mocker.patch.object(
+        orchestrator,
+        "_check_recent_target_interactions",
+        mocker.AsyncMock(return_value={"success": True, "should_skip": False}),
+    )
+    log = mocker.patch.object(orchestrator, "_log_action_in_background")
+
+    task = await orchestrator._enhanced_like_tweet_with_memory(target)
+
+    assert task.start_url == start_url
+    assert task.max_iterations == max_iterations
+    assert check.call_args.kwargs["target"] == memory_target
+    assert log.call_args.kwargs["target"] == memory_target
+    assert log.call_args.kwargs["action_type"].endswith("_task_created")
+
+
+async def test_like_skips_recently_liked_tweet(mocker):
+    orchestrator = OrchestratorAgent()
+    mocker.patch.object(
+        orchestrator,
+        "_check_recent_target_interactions",
+        mocker.AsyncMock(
+            return_value={"success": True, "should_skip": True, "reason": "Recently liked", "interaction_count": 1}
+        ),
+    )
+    log = mocker.patch.object(orchestrator, "_log_action_in_background")
+
+    result = await orchestrator._enhanced_like_tweet_with_memory("https://x.com/user/status/1")
+
+    assert result == "⏭️ Skipping tweet like - Recently liked"
+    assert log.call_args.kwargs["action_type"] == "like_tweet_skipped"
+    assert log.call_args.kwargs["details"] == {"reason": "Recently liked", "interaction_count": 1}
+
+
+async def test_create_smart_cua_task_returns_handoff(mocker):
+    orchestrator = OrchestratorAgent()
+    mocker.patch.object(orchestrator, "_log_action_in_background")
+
+    handoff = await orchestrator._create_smart_cua_task("search for #AI and like tweets")
+
+    assert handoff.ok
+    assert handoff.start_url == "https://x.com"
+    assert handoff.max_iterations == 30
+    assert "#AI" in handoff.prompt
+
+
+async def test_create_smart_cua_task_failure_returns_error(mocker):
+    orchestrator = OrchestratorAgent()
+    mocker.patch(
+        "project_agents.orchestrator_agent._smart_cua_task_prompt",
+        side_effect=RuntimeError("boom"),
+    )
+
+    handoff = await orchestrator._create_smart_cua_task("anything")
+
+    assert not handoff.ok
+    assert handoff.error == "boom"
+
+
+async def test_action_logs_use_direct_postgres_when_configured(mocker):
+    """With a Postgres DSN and asyncpg available, batches bypass the MCP server."""
+    from core.config import settings
+
+    mocker.patch.object(settings, "supabase_postgres_dsn", "postgresql://example")
+    fake_pool = mocker.MagicMock()
+    fake_pool.close = mocker.AsyncMock()
+    fake_asyncpg = mocker.Mock()
+    fake_asyncpg.create_pool = mocker.AsyncMock(return_value=fake_pool)
+    mocker.patch("project_agents.orchestrator_agent.asyncpg", fake_asyncpg)
+    mock_copy = mocker.patch(
+        "project_agents.orchestrator_agent.copy_actions_to_postgres",
+        return_value={"success": True},
+    )
+    mock_bulk = mocker.patch("project_agents.orchestrator_agent.log_actions_to_memory_bulk")
+    orchestrator = OrchestratorAgent()
+    orchestrator.supabase_mcp_server = mocker.MagicMock()
+    orchestrator.supabase_mcp_server.aclose = mocker.AsyncMock()
+
+    orchestrator._log_action_in_background("like_tweet", "SUCCESS", target="t0")
+    await orchestrator.aclose()
+
+    assert mock_copy.call_args.kwargs["pool"] is fake_pool
+    assert [a["target"] for a in mock_copy.call_args.kwargs["actions"]] == ["t0"]
+    mock_bulk.assert_not_called()
+    fake_pool.close.assert_awaited_once()
+
+
+async def test_failed_postgres_connect_is_not_retried_until_the_delay_passes(mocker):
+    """A failed create_pool is remembered so each batch does not wait on it again."""
+    from core.config import settings
+
+    mocker.patch.object(settings, "supabase_postgres_dsn", "postgresql://example")
+    fake_asyncpg = mocker.Mock()
+    fake_asyncpg.create_pool = mocker.AsyncMock(side_effect=OSError("connection refused"))
+    mocker.patch("project_agents.orchestrator_agent.asyncpg", fake_asyncpg)
+    now = mocker.patch("project_agents.orchestrator_agent.time.monotonic", return_value=1000.0)
+    orchestrator = OrchestratorAgent()
+
+    assert await orchestrator._get_pg_pool() is None
+    assert await orchestrator._get_pg_pool() is None
+    assert fake_asyncpg.create_pool.await_count == 1
+
+    now.return_value = 1000.0 + PG_POOL_RETRY_DELAY_SECONDS
+    assert await orchestrator._get_pg_pool() is None
+    assert fake_asyncpg.create_pool.await_count == 2
+
+
+async def test_postgres_pool_from_a_closed_loop_is_dropped(mocker):
+    """A pool bound to a finished event loop is terminated and replaced on the running loop."""
+    from core.config import settings
+
+    mocker.patch.object(settings, "supabase_postgres_dsn", "postgresql://example")
+    old_pool, new_pool = mocker.MagicMock(), mocker.MagicMock()
+    fake_asyncpg = mocker.Mock()
+    fake_asyncpg.create_pool = mocker.AsyncMock(return_value=new_pool)
+    mocker.patch("project_agents.orchestrator_agent.asyncpg", fake_asyncpg)
+    old_loop = asyncio.new_event_loop()
+    old_loop.close()
+    orchestrator = OrchestratorAgent()
+    orchestrator._pg_pool, orchestrator._pg_pool_loop = old_pool, old_loop
+
+    assert await orchestrator._get_pg_pool() is new_pool
+    old_pool.terminate.assert_called_once()
+
+
+async def test_logged_action_logs_success_and_failure(mocker):
+    """One context manager logs the outcome of a tool action, success or failure."""
+    from project_agents.orchestrator_agent import _logged_action
+
+    orchestrator = OrchestratorAgent()
+    log = mocker.patch.object(orchestrator, "_log_action_in_background")
+
+    with _logged_action(orchestrator, "timeline_read", "read_5_tweets", "timeline_read_failed") as outcome:
+        outcome.details = {"num_tweets": 5}
+    assert log.call_args.kwargs["action_type"] == "timeline_read"
+    assert log.call_args.kwargs["result"] == "SUCCESS"
+    assert log.call_args.kwargs["details"] == {"num_tweets": 5}
+
+    with pytest.raises(RuntimeError):
+        with _logged_action(orchestrator, "timeline_read", "read_5_tweets", "timeline_read_failed"):
+            raise RuntimeError("boom")
+    assert log.call_args.kwargs["action_type"] == "timeline_read_failed"
+    assert log.call_args.kwargs["result"] == "FAILED"
+    assert log.call_args.kwargs["details"] == {"error": "boom"}
+
+
+async def test_recent_check_skip_verdict_cached_for_configured_ttl(mocker):
+    """Skip verdicts are reused until settings.memory_check_cache_ttl_seconds elapses."""
+    from core.config import settings
+
+    orchestrator = OrchestratorAgent()
+    check = mocker.patch.object(
+        orchestrator,
+        "_check_recent_target_interactions",
+        mocker.AsyncMock(return_value={"success": True, "should_skip": True}),
+    )
+
+    await orchestrator._check_recent_cached("https://x.com/user/status/1", ["like_tweet"])
+    await orchestrator._check_recent_cached("https://x.com/user/status/1", ["like_tweet"])
+    assert check.await_count == 1
+
+    mocker.patch.object(settings, "memory_check_cache_ttl_seconds", 0)
+    await orchestrator._check_recent_cached("https://x.com/user/status/1", ["like_tweet"])
+    assert check.await_count == 2
+
+
+async def test_warm_up_connects_mcp_server_and_tolerates_failure(mocker, caplog):
+    orchestrator = OrchestratorAgent()
+    orchestrator.supabase_mcp_server = mocker.MagicMock()
+    orchestrator.supabase_mcp_server.__aenter__ = mocker.AsyncMock(return_value="server")
+    orchestrator.supabase_mcp_server.__aexit__ = mocker.AsyncMock(return_value=None)
+
+    await orchestrator.warm_up()
+    orchestrator.supabase_mcp_server.__aenter__.assert_awaited_once()
+
+    orchestrator.supabase_mcp_server.__aenter__ = mocker.AsyncMock(side_effect=RuntimeError("npx missing"))
+    await orchestrator.warm_up()
+    assert "Could not warm up Supabase MCP server: npx missing" in caplog.text
+
+
+async def test_cached_tool_call_reuses_results_until_invalidated():
+    orchestrator = OrchestratorAgent()
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        return {"success": True, "ideas": [], "count": 0}
+
+    first = await orchestrator._cached_tool_call("get_unused_content_ideas", (None, 10), produce)
+    second = await orchestrator._cached_tool_call("get_unused_content_ideas", (None, 10), produce)
+    assert first is second
+    assert len(calls) == 1
+
+    orchestrator._invalidate_tool_results("get_unused_content_ideas")
+    await orchestrator._cached_tool_call("get_unused_content_ideas", (None, 10), produce)
+    assert len(calls) == 2
+
+
+async def test_cached_tool_call_does_not_cache_failures():
+    orchestrator = OrchestratorAgent()
+    calls = []
+
+    async def produce():
+        calls.append(1)
+        return "FAILED: Research query 'x' failed."
+
+    await orchestrator._cached_tool_call("enhanced_research_with_memory", ("x",), produce)
+    await orchestrator._cached_tool_call("enhanced_research_with_memory", ("x",), produce)
+    assert len(calls) == 2
+
+
+async def test_process_mentions_and_approved_replies_tool_runs_both(mocker):
+    orchestrator = OrchestratorAgent()
+    mentions = mocker.patch.object(orchestrator, "process_new_mentions_workflow", mocker.AsyncMock())
+    approved = mocker.patch.object(orchestrator, "process_approved_replies_workflow", mocker.AsyncMock())
+    tool = next(t for t in orchestrator.tools if t.name == "process_mentions_and_approved_replies")
+
+    await tool.on_invoke_tool(mocker.Mock(), "{}")
+
+    mentions.assert_awaited_once()
+    approved.assert_awaited_once()
+
+
+async def test_async_entry_points_do_not_block_the_loop(mocker):
+    post = mocker.patch("project_agents.orchestrator_agent._post_text_tweet", return_value={"id": "1"})
+    orchestrator = OrchestratorAgent()
+    research = mocker.patch.object(
+        orchestrator, "_internal_research_with_params", mocker.AsyncMock(return_value="findings")
+    )
+
+    await orchestrator.arun_simple_post_workflow("hello")
+    assert await orchestrator.aresearch_topic_for_aiified("llms") == "findings"
+
+    post.assert_called_once_with(text="hello")
+    research.assert_awaited_once_with("llms")
+
+
+async def test_mentions_backoff_skips_doubles_and_resets_across_agents(mocker):
+    """The empty-poll backoff is shared by every agent, so it holds across scheduled cycles."""
+    from core.constants import MENTIONS_POLL_BACKOFF_INITIAL_SECONDS
+    from project_agents.orchestrator_agent import _mentions_poll_backoff
+
+    mocker.patch("project_agents.orchestrator_agent.get_agent_state", return_value="42")
+    mocker.patch("project_agents.orchestrator_agent.save_agent_state")
+    get_mentions = mocker.patch(
+        "project_agents.orchestrator_agent.get_mentions",
+        return_value={"data": [], "meta": {"newest_id": "42"}},
+    )
+
+    await OrchestratorAgent().process_new_mentions_workflow()
+    await OrchestratorAgent().process_new_mentions_workflow()
+    assert get_mentions.call_count == 1
+    assert _mentions_poll_backoff.delay == MENTIONS_POLL_BACKOFF_INITIAL_SECONDS
+
+    # Once the delay has elapsed the next poll runs; another empty result doubles the delay
+    _mentions_poll_backoff.last_empty_ts -= MENTIONS_POLL_BACKOFF_INITIAL_SECONDS
+    await OrchestratorAgent().process_new_mentions_workflow()
+    assert get_mentions.call_count == 2
+    assert _mentions_poll_backoff.delay == 2 * MENTIONS_POLL_BACKOFF_INITIAL_SECONDS
+
+    _mentions_poll_backoff.last_empty_ts -= 2 * MENTIONS_POLL_BACKOFF_INITIAL_SECONDS
+    get_mentions.return_value = {"data": [{"id": "43", "text": "hi"}], "meta": {"newest_id": "43"}}
+    orchestrator = OrchestratorAgent()
+    mocker.patch.object(orchestrator, "_process_mention")
+    await orchestrator.process_new_mentions_workflow()
+    assert get_mentions.call_count == 3
+    assert _mentions_poll_backoff.last_empty_ts is None
+    assert _mentions_poll_backoff.delay == MENTIONS_POLL_BACKOFF_INITIAL_SECONDS
+
+
+async def test_last_mention_id_cached_across_agents_until_ttl(mocker):
+    """The last mention ID is read once per TTL for all agents and updated on save."""
+    from core.constants import LAST_MENTION_ID_CACHE_TTL_SECONDS
+    from project_agents.orchestrator_agent import _last_mention_id, _mentions_poll_backoff
+
+    get_state = mocker.patch("project_agents.orchestrator_agent.get_agent_state", return_value="42")
+    save_state = mocker.patch("project_agents.orchestrator_agent.save_agent_state")
+    get_mentions = mocker.patch(
+        "project_agents.orchestrator_agent.get_mentions",
+        return_value={"data": [{"id": "43", "text": "hi"}], "meta": {"newest_id": "43"}},
+    )
+    mocker.patch.object(OrchestratorAgent, "_process_mention")
+
+    await OrchestratorAgent().process_new_mentions_workflow()
+    await OrchestratorAgent().process_new_mentions_workflow()
+    assert get_state.call_count == 1
+    save_state.assert_called_with("last_processed_mention_id_default_user", "43")
+    # The second poll used the ID saved by the first rather than the stale store value
+    assert [c.kwargs["since_id"] for c in get_mentions.call_args_list] == ["42", "43"]
+
+    # Once expired, the state store is read again to pick up other writers
+    _last_mention_id.loaded_at -= LAST_MENTION_ID_CACHE_TTL_SECONDS
+    _mentions_poll_backoff.reset()  # the second poll came back empty
+    get_state.return_value = "99"
+    await OrchestratorAgent().process_new_mentions_workflow()
+    assert get_state.call_count == 2
+    assert get_mentions.call_args.kwargs["since_id"] == "99"
+
+
+async def test_saved_content_ideas_are_deduped_across_agents(mocker):
+    """Ideas saved by one agent are skipped by later agents without a memory round-trip."""
+    save_one = mocker.patch(
+        "project_agents.orchestrator_agent.save_content_idea_to_memory", return_value={"success": True}
+    )
+    save_bulk = mocker.patch(
+        "project_agents.orchestrator_agent.save_content_ideas_to_memory_bulk", return_value={"success": True}
+    )
+    get_unused = mocker.patch("project_agents.orchestrator_agent.get_unused_content_ideas_from_memory")
+
+    def make_orchestrator():
+        orchestrator = OrchestratorAgent()
+        orchestrator.supabase_mcp_server = mocker.MagicMock()
+        orchestrator.supabase_mcp_server.__aenter__ = mocker.AsyncMock(return_value="server")
+        orchestrator.supabase_mcp_server.__aexit__ = mocker.AsyncMock(return_value=None)
+        return orchestrator
+
+    await make_orchestrator()._save_content_idea_to_memory("idea", source_url="https://x.com/a")
+    result = await make_orchestrator()._save_content_idea_to_memory("idea again", source_url="https://x.com/a")
+    assert result == {"success": True, "deduped": True}
+    save_one.assert_called_once()
+
+    await make_orchestrator()._save_content_ideas_bulk(
+        [{"idea_summary": "idea", "source_url": "https://x.com/a"}, {"idea_summary": "new idea"}]
+    )
+    assert [i["idea_summary"] for i in save_bulk.call_args.kwargs["ideas"]] == ["new idea"]
+    # Stored (including used) ideas are skipped by the INSERT, so nothing is preloaded
+    get_unused.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "success, expected_reply, expected_result",
+    [(True, "✅ Successfully liked tweet", "SUCCESS"), (False, "❌ Failed to like tweet", "COMPLETED")],
+)
+async def test_like_tool_reports_the_cua_success_flag(mocker, success, expected_reply, expected_result):
+    """A CUA run that did not report success is neither returned nor logged as a like."""
+    from core.models import CuaResult, CuaTask
+
+    orchestrator = OrchestratorAgent()
+    task = CuaTask(prompt="like it", start_url="https://x.com/a/status/1", max_iterations=5)
+    mocker.patch.object(orchestrator, "_enhanced_like_tweet_with_memory", mocker.AsyncMock(return_value=task))
+    log = mocker.patch.object(orchestrator, "_log_action_in_background")
+    ctx = mocker.Mock()
+    ctx.context.cua_session.run_task = mocker.AsyncMock(
+        return_value=CuaResult(success=success, output="FAILED: could not find the SUCCESS button")
+    )
+    tool = next(t for t in orchestrator.tools if t.name == "enhanced_like_tweet_with_memory")
+
+    reply = await tool.on_invoke_tool(ctx, '{"tweet_url": "https://x.com/a/status/1"}')
+
+    assert reply.startswith(expected_reply)
+    assert log.call_args.kwargs["result"] == expected_result
+
+
+@pytest.mark.parametrize(
+    "sentence, expected",
+    [
+        ("New LLMs are released almost every week by the major research labs", True),
+        ("Foundation models keep improving on reasoning benchmarks this quarter", True),
+        ("Open datasets are now the bottleneck for training smaller assistants", True),
+        ("The spokesperson said nothing new about the product roadmap today", False),
+    ],
+)
+async def test_idea_sentences_match_keywords_and_their_plurals(sentence, expected):
+    from project_agents.orchestrator_agent import _is_idea_sentence
+
+    assert _is_idea_sentence(sentence) is expected
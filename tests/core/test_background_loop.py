@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+from core.background_loop import get_background_loop, run_coroutine_sync
+
+
+def test_run_coroutine_sync_reuses_one_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    first = run_coroutine_sync(current_loop())
+    second = run_coroutine_sync(current_loop())
+    assert first is second is get_background_loop()
+
+
+def test_run_coroutine_sync_reraises_exceptions():
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_coroutine_sync(fail())
+
+
+def test_run_coroutine_sync_rejects_calls_from_background_loop():
+    async def nested():
+        async def noop():
+            return None
+
+        with pytest.raises(RuntimeError):
+            run_coroutine_sync(noop())
+
+    run_coroutine_sync(nested())
@@ -0,0 +1,118 @@
+import base64
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from core.cua_workflow import (  # noqa: E402
+    CuaWorkflowRunner,
+    _group_output_by_type,
+    _message_text,
+    _screenshot_size,
+    _terminal_marker,
+)
+
+
+def test_message_text_prefers_direct_text_attributes():
+    assert _message_text(SimpleNamespace(text="direct")) == "direct"
+    assert _message_text(SimpleNamespace(content=SimpleNamespace(text="nested"))) == "nested"
+
+
+def test_message_text_reads_first_non_empty_content_part():
+    msg = SimpleNamespace(content=[SimpleNamespace(text=""), SimpleNamespace(text="SUCCESS: done")])
+    assert _message_text(msg) == "SUCCESS: done"
+
+
+class _ReprOnly:
+    def __init__(self, rendered: str) -> None:
+        self.rendered = rendered
+
+    def __repr__(self) -> str:
+        return self.rendered
+
+
+@pytest.mark.parametrize(
+    "rendered, expected",
+    [
+        ("Message(text='FAILED: no tweet')", "FAILED: no tweet"),
+        # repr switches to double quotes when the text contains an apostrophe
+        ('Message(text="SUCCESS: can\'t miss it")', "SUCCESS: can't miss it"),
+        ("Message(text='it\\'s escaped', other='x')", "it\\'s escaped"),
+        ("Message(id='1')", ""),
+    ],
+)
+def test_message_text_falls_back_to_repr_in_either_quote_style(rendered, expected):
+    assert _message_text(_ReprOnly(rendered)) == expected
+
+
+def _old_marker_chain(text):
+    """The `in` checks _terminal_marker replaced, kept as the reference for priority."""
+    if "SUCCESS" in text:
+        return "SUCCESS"
+    elif "SESSION_INVALIDATED" in text:
+        return "SESSION_INVALIDATED"
+    elif "FAILED" in text:
+        return "FAILED"
+    return None
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("FAILED first, then SUCCESS", "SUCCESS"),
+        ("SESSION_INVALIDATED and FAILED", "SESSION_INVALIDATED"),
+        ("FAILED ... SESSION_INVALIDATED ... SUCCESS", "SUCCESS"),
+        ("FAILED: could not find the tweet", "FAILED"),
+        ("Task finished without a marker", None),
+        ("", None),
+    ],
+)
+def test_terminal_marker_matches_the_old_priority_chain(text, expected):
+    assert _terminal_marker(text) == expected == _old_marker_chain(text)
+
+
+class _FakeComputer:
+    def __init__(self, png: bytes) -> None:
+        self.png = png
+
+    async def screenshot_bytes(self) -> bytes:
+        return self.png
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("num_bytes, padding", [(300, 0), (301, 2), (302, 1)])
+async def test_screenshot_size_matches_base64_length(num_bytes, padding):
+    png = (bytes(range(256)) * 2)[:num_bytes]
+    encoded = base64.b64encode(png)
+    assert len(encoded) - len(encoded.rstrip(b"=")) == padding
+    assert len(base64.b64decode(encoded)) == num_bytes
+
+    assert await _screenshot_size(_FakeComputer(png)) == len(encoded)
+
+
+def _final_result(*items):
+    return CuaWorkflowRunner()._final_result(_group_output_by_type(items))
+
+
+@pytest.mark.parametrize(
+    "item, success, output",
+    [
+        (SimpleNamespace(type="text", text="SUCCESS: liked"), True, "SUCCESS: liked"),
+        (SimpleNamespace(type="message", text="SUCCESS: replied"), True, "SUCCESS: replied"),
+        # A failure report quoting the expected SUCCESS message is not a success
+        (SimpleNamespace(type="text", text="FAILED: never saw SUCCESS"), False, "FAILED: never saw SUCCESS"),
+        (SimpleNamespace(type="message", text="FAILED: never saw SUCCESS"), False, "FAILED: never saw SUCCESS"),
+        (SimpleNamespace(type="message", text="SESSION_INVALIDATED"), False, "SESSION_INVALIDATED"),
+        (SimpleNamespace(type="message", text="could not post"), False, "COMPLETED: CUA workflow finished"),
+        (
+            SimpleNamespace(type="reasoning", content="SUCCESS"),
+            True,
+            "SUCCESS: Task completed successfully (from reasoning)",
+        ),
+    ],
+)
+def test_final_result_success_comes_from_the_terminal_marker(item, success, output):
+    result = _final_result(item)
+    assert result.success is success
+    assert result.output == output
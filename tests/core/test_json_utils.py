@@ -0,0 +1,28 @@
+import json
+
+import pytest
+
+from core import json_utils
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(json_utils, "orjson", None)
+    return request.param
+
+
+def test_dumps_is_compact_and_unescaped(backend):
+    assert json_utils.dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'
+
+
+def test_loads_round_trip(backend):
+    data = {"ideas": [{"id": 1, "idea_text": "LLM agents"}], "count": 1}
+    assert json_utils.loads(json_utils.dumps(data)) == data
+
+
+def test_loads_invalid_raises_json_decode_error(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads("not json")
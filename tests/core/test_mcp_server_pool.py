@@ -0,0 +1,144 @@
+import asyncio
+
+import anyio
+import pytest
+from mcp.shared.exceptions import McpError
+from mcp.types import CONNECTION_CLOSED, INTERNAL_ERROR, ErrorData
+
+from core import mcp_server_pool
+from core.mcp_server_pool import get_shared_mcp_server
+
+
+class FakeServer:
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.connect_calls = 0
+        self.cleanup_calls = 0
+
+    async def connect(self):
+        self.connect_calls += 1
+
+    async def cleanup(self):
+        self.cleanup_calls += 1
+
+
+@pytest.fixture(autouse=True)
+def fake_mcp_server(monkeypatch):
+    monkeypatch.setattr(mcp_server_pool, "MCPServerStdio", FakeServer)
+    get_shared_mcp_server.cache_clear()
+    yield
+    get_shared_mcp_server.cache_clear()
+
+
+def test_same_config_returns_same_shared_server():
+    first = get_shared_mcp_server("cmd", ("a", "token"))
+    second = get_shared_mcp_server("cmd", ("a", "token"))
+    other = get_shared_mcp_server("cmd", ("a", "other-token"))
+    assert first is second
+    assert first is not other
+
+
+@pytest.mark.asyncio
+async def test_overlapping_users_share_one_connection():
+    shared = get_shared_mcp_server("cmd", ("a",))
+
+    async with shared as outer:
+        async with shared as inner:
+            assert inner is outer
+            assert outer.connect_calls == 1
+        assert outer.cleanup_calls == 0
+    await shared.aclose()
+    assert outer.cleanup_calls == 1
+    assert outer.kwargs["params"] == {"command": "cmd", "args": ["a"]}
+
+
+def test_each_event_loop_gets_its_own_server():
+    # Synchronous on purpose: each asyncio.run() starts a separate event loop
+    shared = get_shared_mcp_server("cmd", ("a",))
+
+    async def enter():
+        async with shared as server:
+            return server
+
+    assert asyncio.run(enter()) is not asyncio.run(enter())
+
+
+@pytest.mark.asyncio
+async def test_connection_is_kept_alive_until_aclose():
+    shared = get_shared_mcp_server("cmd", ("a",))
+
+    async with shared as first:
+        pass
+    async with shared as second:
+        assert second is first
+    assert first.connect_calls == 1
+    assert first.cleanup_calls == 0
+    await shared.aclose()
+    assert first.cleanup_calls == 1
+    async with shared:
+        pass
+    assert first.connect_calls == 2
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_aclose_waits_for_active_users():
+    shared = get_shared_mcp_server("cmd", ("a",))
+
+    async with shared as server:
+        await shared.aclose()
+        assert server.cleanup_calls == 0
+    assert server.cleanup_calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "error",
+    [
+        McpError(ErrorData(code=CONNECTION_CLOSED, message="Connection closed")),
+        anyio.ClosedResourceError(),
+        anyio.BrokenResourceError(),
+    ],
+)
+async def test_dead_server_is_reconnected_on_next_use(error):
+    shared = get_shared_mcp_server("cmd", ("a",))
+
+    with pytest.raises(type(error)):
+        async with shared as server:
+            raise error
+    assert server.cleanup_calls == 1
+    async with shared:
+        pass
+    assert server.connect_calls == 2
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_other_mcp_errors_keep_the_connection():
+    shared = get_shared_mcp_server("cmd", ("a",))
+
+    with pytest.raises(McpError):
+        async with shared as server:
+            raise McpError(ErrorData(code=INTERNAL_ERROR, message="bad query"))
+    async with shared:
+        pass
+    assert server.connect_calls == 1
+    assert server.cleanup_calls == 0
+    await shared.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connected_server_is_entered_without_the_lock():
+    shared = get_shared_mcp_server("cmd", ("a",))
+
+    async with shared:
+        pass
+    state = shared._states[asyncio.get_running_loop()]
+    async with state.lock:
+        async def use():
+            async with shared as server:
+                return server
+
+        assert await asyncio.wait_for(use(), timeout=1) is state.server
+    await shared.aclose()
+    assert state.server.cleanup_calls == 1
@@ -0,0 +1,101 @@
+import pytest
+
+from tools.memory_tools import (
+    _content_idea_values_sql,
+    save_content_idea_to_memory,
+    save_content_ideas_to_memory_bulk,
+)
+
+
+@pytest.mark.asyncio
+async def test_content_idea_insert_skips_stored_ideas(mocker):
+    """The INSERT skips stored ideas, keyed on source URL when there is one, else on text."""
+    server = mocker.Mock()
+    server.call_tool = mocker.AsyncMock(return_value="ok")
+
+    await save_content_ideas_to_memory_bulk(
+        server,
+        [
+            {"idea_summary": "from a url", "source_url": "https://x.com/a"},
+            {"idea_summary": "from a query", "source_query": "llms"},
+        ],
+    )
+
+    sql = server.call_tool.call_args.args[1]["query"]
+    assert "('from a url', 'https://x.com/a', NULL, NULL, TRUE)" in sql
+    assert "('from a query', 'llms', NULL, NULL, FALSE)" in sql
+    assert "NOT (v.dedup_on_source AND EXISTS (SELECT 1 FROM content_ideas c WHERE c.source = v.source))" in sql
+    assert "NOT (NOT v.dedup_on_source AND EXISTS (SELECT 1 FROM content_ideas c WHERE c.idea_text = v.idea_text))" in sql
+
+
+@pytest.mark.asyncio
+async def test_single_content_idea_uses_the_same_deduplicating_insert(mocker):
+    """A single idea goes through the same deduplicating INSERT."""
+    server = mocker.Mock()
+    server.call_tool = mocker.AsyncMock(return_value="ok")
+
+    await save_content_idea_to_memory(server, "an idea", source_url="https://x.com/a")
+
+    sql = server.call_tool.call_args.args[1]["query"]
+    assert "FROM (VALUES ('an idea', 'https://x.com/a', NULL, NULL, TRUE))" in sql
+    assert "WHERE NOT (v.dedup_on_source AND EXISTS" in sql
+
+
+def _execute_sql_result(mocker, text):
+    return mocker.Mock(content=[mocker.Mock(text=text)])
+
+
+@pytest.mark.asyncio
+async def test_bulk_save_reports_inserted_and_skipped_ideas(mocker):
+    """count is the number of rows RETURNING gave back, not the number of ideas sent."""
+    server = mocker.Mock()
+    server.call_tool = mocker.AsyncMock(
+        return_value=_execute_sql_result(mocker, '[{"id": 1, "created_at": "2025-01-01T00:00:00Z"}]')
+    )
+
+    result = await save_content_ideas_to_memory_bulk(
+        server, [{"idea_summary": "new"}, {"idea_summary": "stored"}, {"idea_summary": "also stored"}]
+    )
+
+    assert result["count"] == 1
+    assert result["skipped"] == 2
+
+
+@pytest.mark.asyncio
+async def test_single_save_reports_a_skipped_idea(mocker):
+    server = mocker.Mock()
+    server.call_tool = mocker.AsyncMock(return_value=_execute_sql_result(mocker, "[]"))
+
+    result = await save_content_idea_to_memory(server, "stored", source_url="https://x.com/a")
+
+    assert result["success"] is True
+    assert result["saved"] is False
+
+
+def test_content_idea_values_escape_single_quotes():
+    row = _content_idea_values_sql(
+        "it's an idea'); DROP TABLE content_ideas; --",
+        source_url="https://x.com/o'brien",
+        topic_category="AI's future",
+        relevance_score=7,
+    )
+    assert row == (
+        "('it''s an idea''); DROP TABLE content_ideas; --', 'https://x.com/o''brien', "
+        "'AI''s future', 7, TRUE)"
+    )
+
+
+def test_content_idea_values_use_null_for_missing_fields():
+    assert _content_idea_values_sql("idea") == "('idea', 'research', NULL, NULL, FALSE)"
+    assert _content_idea_values_sql("idea", source_query="q'uery") == "('idea', 'q''uery', NULL, NULL, FALSE)"
+
+
+@pytest.mark.parametrize("score, expected", [(7.9, "7"), ("8", "8")])
+def test_content_idea_values_render_scores_as_integer_literals(score, expected):
+    assert _content_idea_values_sql("idea", relevance_score=score) == f"('idea', 'research', NULL, {expected}, FALSE)"
+
+
+@pytest.mark.parametrize("score", ["8); DROP TABLE content_ideas; --", "high"])
+def test_content_idea_values_reject_non_numeric_scores(score):
+    with pytest.raises(ValueError):
+        _content_idea_values_sql("idea", relevance_score=score)
@@ -18,7 +18,7 @@ def test_successful_tweet_post(mocker):
         def json(self):
             return {"data": {"id": "123", "text": "Test tweet"}}
 
-    mock_post = mocker.patch("tools.x_api_tools.requests.post", return_value=FakeResponse())
+    mock_post = mocker.patch("tools.x_api_tools._http.post", return_value=FakeResponse())
     result = post_text_tweet("Hello world")
     assert result == {"data": {"id": "123", "text": "Test tweet"}}
     mock_post.assert_called_once_with(
@@ -39,7 +39,7 @@ def test_requests_post_network_error(mocker):
     """Network errors during requests.post raise XApiError."""
     mocker.patch("tools.x_api_tools.get_valid_x_token", return_value="FAKE_TOKEN")
     mocker.patch(
-        "tools.x_api_tools.requests.post",
+        "tools.x_api_tools._http.post",
         side_effect=requests.exceptions.ConnectionError("conn err"),
     )
     with pytest.raises(XApiError) as exc:
@@ -58,7 +58,7 @@ def test_x_api_response_error_code(mocker):
         def json(self):
             return {"title": "Forbidden", "detail": "No permission"}
 
-    mocker.patch("tools.x_api_tools.requests.post", return_value=FakeResp())
+    mocker.patch("tools.x_api_tools._http.post", return_value=FakeResp())
     with pytest.raises(XApiError) as exc:
         post_text_tweet("Hello")
     assert "Tweet creation failed with status code 403" in str(exc.value)
@@ -75,7 +75,7 @@ def test_invalid_json_response_after_success(mocker):
         def json(self):
             raise ValueError("no json")
 
-    mocker.patch("tools.x_api_tools.requests.post", return_value=BadJsonResp())
+    mocker.patch("tools.x_api_tools._http.post", return_value=BadJsonResp())
     with pytest.raises(XApiError) as exc:
         post_text_tweet("Hello")
     assert "Failed to parse tweet response JSON" in str(exc.value)
@@ -112,7 +112,7 @@ def test_get_mentions_success_with_since(mocker):
             return FakeMentionsRes()
         raise ValueError(f"Unexpected URL: {url}")
 
-    mocker.patch("tools.x_api_tools.requests.get", side_effect=fake_get)
+    mocker.patch("tools.x_api_tools._http.get", side_effect=fake_get)
 
     result = get_mentions(since_id="since123")
     assert result == {
@@ -154,7 +154,7 @@ def test_get_mentions_success_without_since(mocker):
             return FakeMentionsRes()
         raise ValueError(f"Unexpected URL: {url}")
 
-    mocker.patch("tools.x_api_tools.requests.get", side_effect=fake_get)
+    mocker.patch("tools.x_api_tools._http.get", side_effect=fake_get)
 
     result = get_mentions()
     assert result == {"status": "ok"}
@@ -173,7 +173,7 @@ def test_get_mentions_user_info_error(mocker):
         def json(self):
             return {"title": "Forbidden"}
 
-    mocker.patch("tools.x_api_tools.requests.get", return_value=ErrRes())
+    mocker.patch("tools.x_api_tools._http.get", return_value=ErrRes())
     with pytest.raises(XApiError):
         get_mentions()
 
@@ -188,7 +188,7 @@ def test_get_mentions_user_info_json_error(mocker):
         def json(self):
             raise ValueError("bad json")
 
-    mocker.patch("tools.x_api_tools.requests.get", return_value=BadJsonRes())
+    mocker.patch("tools.x_api_tools._http.get", return_value=BadJsonRes())
     with pytest.raises(XApiError):
         get_mentions()
 
@@ -216,7 +216,7 @@ def test_get_mentions_mentions_call_error(mocker):
             return ErrMentionsRes()
         raise ValueError("Unexpected URL")
 
-    mocker.patch("tools.x_api_tools.requests.get", side_effect=side_effect)
+    mocker.patch("tools.x_api_tools._http.get", side_effect=side_effect)
     with pytest.raises(XApiError):
         get_mentions()
 
@@ -244,7 +244,7 @@ def test_get_mentions_mentions_json_error(mocker):
             return BadJsonMentionsRes()
         raise ValueError("Unexpected URL")
 
-    mocker.patch("tools.x_api_tools.requests.get", side_effect=side_effect)
+    mocker.patch("tools.x_api_tools._http.get", side_effect=side_effect)
     with pytest.raises(XApiError):
         get_mentions()
 
@@ -269,7 +269,7 @@ def test_successful_tweet_post_with_reply(mocker):
         def json(self):
             return {"data": {"id": "456", "text": "Reply tweet"}}
 
-    mock_post = mocker.patch("tools.x_api_tools.requests.post", return_value=FakeResponse())
+    mock_post = mocker.patch("tools.x_api_tools._http.post", return_value=FakeResponse())
     result = post_text_tweet("Reply content", in_reply_to_tweet_id="789")
     assert result == {"data": {"id": "456", "text": "Reply tweet"}}
     mock_post.assert_called_once_with(
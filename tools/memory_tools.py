@@ -8,9 +8,10 @@ tool to perform database operations for learning and deduplication.
 import json
 import logging
 from datetime import datetime, timezone
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, List, Sequence
 
 from agents.mcp.server import MCPServerStdio
+from core import json_utils
 
 
 logger = logging.getLogger(__name__)
@@ -46,7 +47,7 @@ async def log_action_to_memory(
         # Prepare metadata - include agent_name in metadata since the table doesn't have that column
         metadata = details or {}
         metadata['agent_name'] = agent_name
-        metadata_json = json.dumps(metadata)
+        metadata_json = json_utils.dumps(metadata)
         
         # Build SQL query with values directly embedded (MCP doesn't support parameterized queries)
         # Use single quotes and escape any single quotes in the values
@@ -78,6 +79,110 @@ async def log_action_to_memory(
         raise
 
 
+async def log_actions_to_memory_bulk(
+    server: MCPServerStdio,
+    agent_name: str,
+    actions: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Log several agent actions to the strategic memory database in one INSERT.
+    
+    Args:
+        server: The MCP server instance for Supabase connection
+        agent_name: Name of the agent performing the actions (will be stored in metadata)
+        actions: Action dicts with 'action_type', 'result' and optional 'target' and 'details' keys
+        
+    Returns:
+        Dict containing the result of the database operation and the number of rows written
+        
+    Raises:
+        Exception: If the database operation fails
+    """
+    logger.info(f"📝 Logging {len(actions)} actions to memory in bulk")
+    
+    try:
+        rows = []
+        for action in actions:
+            metadata = dict(action.get("details") or {})
+            metadata['agent_name'] = agent_name
+            rows.append({
+                "action_type": action["action_type"],
+                "target": action.get("target") or "",
+                "result": action["result"],
+                "metadata": metadata,
+            })
+        
+        # Serialize the whole batch in one pass and let Postgres expand it into rows
+        rows_escaped = json_utils.dumps(rows).replace("'", "''")
+        sql_query = f"""
+        INSERT INTO agent_actions (action_type, target, result, metadata, timestamp)
+        SELECT action_type, target, result, metadata, NOW()
+        FROM jsonb_to_recordset('{rows_escaped}'::jsonb)
+            AS rows(action_type text, target text, result text, metadata jsonb)
+        RETURNING id, timestamp;
+        """
+        
+        result_data = await server.call_tool(
+            "execute_sql",
+            {
+                "project_id": "vgqkwooelncsckghajpg",
+                "query": sql_query
+            }
+        )
+        
+        logger.info(f"✅ Logged {len(actions)} actions successfully")
+        return {"success": True, "count": len(actions), "data": result_data}
+        
+    except Exception as e:
+        logger.error(f"❌ Failed to bulk log actions to memory: {e}")
+        raise
+
+
+async def copy_actions_to_postgres(
+    pool: Any,
+    agent_name: str,
+    actions: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Log several agent actions straight to Postgres with a binary COPY.
+    
+    This bypasses the MCP server for append-only action logging.
+    
+    Args:
+        pool: An asyncpg connection pool for the Supabase Postgres database
+        agent_name: Name of the agent performing the actions (will be stored in metadata)
+        actions: Action dicts with 'action_type', 'result' and optional 'target' and 'details' keys
+        
+    Returns:
+        Dict containing the result of the database operation and the number of rows written
+        
+    Raises:
+        Exception: If the database operation fails
+    """
+    now = datetime.now(timezone.utc)
+    records = []
+    for action in actions:
+        metadata = dict(action.get("details") or {})
+        metadata['agent_name'] = agent_name
+        records.append((
+            action["action_type"],
+            action.get("target") or "",
+            action["result"],
+            json_utils.dumps(metadata),
+            now,
+        ))
+    
+    try:
+        async with pool.acquire() as conn:
+            await conn.copy_records_to_table(
+                "agent_actions",
+                records=records,
+                columns=["action_type", "target", "result", "metadata", "timestamp"],
+            )
+        return {"success": True, "count": len(records)}
+    except Exception as e:
+        logger.error(f"❌ Failed to copy actions to Postgres: {e}")
+        raise
+
+
 async def retrieve_recent_actions_from_memory(
     server: MCPServerStdio,
     action_type: Optional[str] = None,
@@ -139,7 +244,7 @@ async def retrieve_recent_actions_from_memory(
             for content_item in result_data.content:
                 if hasattr(content_item, 'text'):
                     try:
-                        json_data = json.loads(content_item.text)
+                        json_data = json_utils.loads(content_item.text)
                         if isinstance(json_data, list):
                             actions = json_data
                         break
@@ -162,6 +267,58 @@ async def retrieve_recent_actions_from_memory(
         raise
 
 
+def _content_idea_values_sql(
+    idea_summary: str,
+    source_url: Optional[str] = None,
+    source_query: Optional[str] = None,
+    topic_category: Optional[str] = None,
+    relevance_score: Optional[int] = None,
+) -> str:
+    """Build the escaped VALUES tuple for one content idea (see _insert_new_content_ideas_sql)."""
+    idea_escaped = idea_summary.replace("'", "''")
+    source = source_url or source_query or "research"
+    source_escaped = source.replace("'", "''")
+    topic_sql = "'" + topic_category.replace("'", "''") + "'" if topic_category else "NULL"
+    # int() keeps the interpolated score a bare integer literal (fits a smallint column)
+    score_sql = str(int(relevance_score)) if relevance_score is not None else "NULL"
+    # Ideas with a source URL are identified by it, the rest by their text
+    dedup_on_source = "TRUE" if source_url else "FALSE"
+    return f"('{idea_escaped}', '{source_escaped}', {topic_sql}, {score_sql}, {dedup_on_source})"
+
+
+def _insert_new_content_ideas_sql(rows: List[str]) -> str:
+    """Build an INSERT of content idea VALUES rows that skips ideas already stored.
+    
+    An idea is skipped if a stored row (used or not) has the same source URL, or the
+    same text when it has no source URL. Each check is a separate equality lookup so
+    it can use an index; without indexes on content_ideas.source and idea_text (see
+    the schema in memory-bank/systemPatterns.md) every save scans the whole table.
+    RETURNING yields one row per idea actually inserted.
+    """
+    return f"""
+        INSERT INTO content_ideas (idea_text, source, topic_category, relevance_score, created_at)
+        SELECT v.idea_text, v.source, v.topic_category::text, v.relevance_score::int, NOW()
+        FROM (VALUES {", ".join(rows)}) AS v(idea_text, source, topic_category, relevance_score, dedup_on_source)
+        WHERE NOT (v.dedup_on_source AND EXISTS (SELECT 1 FROM content_ideas c WHERE c.source = v.source))
+        AND NOT (NOT v.dedup_on_source AND EXISTS (SELECT 1 FROM content_ideas c WHERE c.idea_text = v.idea_text))
+        RETURNING id, created_at;
+        """
+
+
+def _returned_rows(result_data: Any) -> List[Any]:
+    """Return the JSON rows in an execute_sql result, or [] if there are none."""
+    for content_item in getattr(result_data, 'content', None) or []:
+        text = getattr(content_item, 'text', None)
+        if text is not None:
+            try:
+                rows = json_utils.loads(text)
+            except json.JSONDecodeError:
+                logger.warning("Could not parse execute_sql result: %.200s", text)
+                return []
+            return rows if isinstance(rows, list) else []
+    return []
+
+
 async def save_content_idea_to_memory(
     server: MCPServerStdio,
     idea_summary: str,
@@ -170,7 +327,7 @@ async def save_content_idea_to_memory(
     topic_category: Optional[str] = None,
     relevance_score: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Save a content idea to the strategic memory database.
+    """Save a content idea to the strategic memory database, unless it is already stored.
     
     Args:
         server: The MCP server instance for Supabase connection
@@ -181,7 +338,7 @@ async def save_content_idea_to_memory(
         relevance_score: Relevance score 1-10 (optional)
         
     Returns:
-        Dict containing the result of the database operation
+        Dict containing the result of the database operation and whether a row was written ('saved')
         
     Raises:
         Exception: If the database operation fails
@@ -189,33 +346,66 @@ async def save_content_idea_to_memory(
     logger.info(f"💡 Saving content idea to memory: {idea_summary[:50]}...")
     
     try:
-        # Prepare values - escape single quotes
-        idea_escaped = idea_summary.replace("'", "''")
-        source = source_url or source_query or "research"
-        source_escaped = source.replace("'", "''")
+        sql_query = _insert_new_content_ideas_sql([
+            _content_idea_values_sql(idea_summary, source_url, source_query, topic_category, relevance_score)
+        ])
         
-        # Build the SQL query with values directly embedded
-        sql_query = f"""
-        INSERT INTO content_ideas (idea_text, source, topic_category, relevance_score, created_at)
-        VALUES ('{idea_escaped}', '{source_escaped}', """
+        # Execute the SQL via MCP server
+        result_data = await server.call_tool(
+            "execute_sql",
+            {
+                "project_id": "vgqkwooelncsckghajpg",
+                "query": sql_query
+            }
+        )
         
-        # Handle optional values
-        if topic_category:
-            topic_escaped = topic_category.replace("'", "''")
-            sql_query += f"'{topic_escaped}'"
+        saved = bool(_returned_rows(result_data))
+        if saved:
+            logger.info("✅ Content idea saved successfully")
         else:
-            sql_query += "NULL"
+            logger.info("Content idea already stored, skipped")
+        return {"success": True, "saved": saved, "data": result_data}
         
-        sql_query += ", "
+    except Exception as e:
+        logger.error(f"❌ Failed to save content idea to memory: {e}")
+        raise
+
+
+async def save_content_ideas_to_memory_bulk(
+    server: MCPServerStdio,
+    ideas: List[Dict[str, Any]],
+) -> Dict[str, Any]:
+    """Save several content ideas to the strategic memory database in one INSERT.
+    
+    Ideas already stored (see _insert_new_content_ideas_sql) are skipped by the database.
+    
+    Args:
+        server: The MCP server instance for Supabase connection
+        ideas: Idea dicts with an 'idea_summary' key and optional 'source_url', 'source_query',
+            'topic_category' and 'relevance_score' keys (same meaning as save_content_idea_to_memory)
         
-        if relevance_score is not None:
-            sql_query += str(relevance_score)
-        else:
-            sql_query += "NULL"
+    Returns:
+        Dict containing the result of the database operation and the number of rows written
+        ('count') and of ideas skipped as already stored ('skipped')
         
-        sql_query += ", NOW()) RETURNING id, created_at;"
+    Raises:
+        Exception: If the database operation fails
+    """
+    logger.info(f"💡 Saving {len(ideas)} content ideas to memory in bulk")
+    
+    try:
+        rows = [
+            _content_idea_values_sql(
+                idea["idea_summary"],
+                idea.get("source_url"),
+                idea.get("source_query"),
+                idea.get("topic_category"),
+                idea.get("relevance_score"),
+            )
+            for idea in ideas
+        ]
+        sql_query = _insert_new_content_ideas_sql(rows)
         
-        # Execute the SQL via MCP server
         result_data = await server.call_tool(
             "execute_sql",
             {
@@ -224,11 +414,12 @@ async def save_content_idea_to_memory(
             }
         )
         
-        logger.info(f"✅ Content idea saved successfully")
-        return {"success": True, "data": result_data}
+        saved = len(_returned_rows(result_data))
+        logger.info("✅ Saved %d content ideas (%d already stored, skipped)", saved, len(ideas) - saved)
+        return {"success": True, "count": saved, "skipped": len(ideas) - saved, "data": result_data}
         
     except Exception as e:
-        logger.error(f"❌ Failed to save content idea to memory: {e}")
+        logger.error(f"❌ Failed to bulk save content ideas to memory: {e}")
         raise
 
 
@@ -287,7 +478,7 @@ async def get_unused_content_ideas_from_memory(
             for content_item in result_data.content:
                 if hasattr(content_item, 'text'):
                     try:
-                        json_data = json.loads(content_item.text)
+                        json_data = json_utils.loads(content_item.text)
                         if isinstance(json_data, list):
                             ideas = json_data
                         break
@@ -356,7 +547,7 @@ async def mark_content_idea_as_used(
 async def check_recent_target_interactions(
     server: MCPServerStdio,
     target: str,
-    action_types: Optional[List[str]] = None,
+    action_types: Optional[Sequence[str]] = None,
     hours_back: int = 24,
 ) -> Dict[str, Any]:
     """Check if we've recently interacted with a specific target to avoid spam.
@@ -420,7 +611,7 @@ async def check_recent_target_interactions(
             for content_item in result_data.content:
                 if hasattr(content_item, 'text'):
                     try:
-                        json_data = json.loads(content_item.text)
+                        json_data = json_utils.loads(content_item.text)
                         if isinstance(json_data, list):
                             interactions = json_data
                         break
@@ -4,11 +4,20 @@ import logging
 from typing import Any, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from core.constants import X_API_HTTP_POOL_SIZE
 from core.oauth_manager import OAuthError, get_valid_x_token
 
 logger = logging.getLogger(__name__)
 
+# Shared session so repeated X API calls reuse keep-alive TCP/TLS connections
+_http = requests.Session()
+_http.mount(
+    "https://",
+    HTTPAdapter(pool_connections=X_API_HTTP_POOL_SIZE, pool_maxsize=X_API_HTTP_POOL_SIZE),
+)
+
 
 class XApiError(Exception):
     """Custom exception for X API request failures."""
@@ -45,7 +54,7 @@ def post_text_tweet(text: str, in_reply_to_tweet_id: Optional[str] = None) -> di
     if in_reply_to_tweet_id:
         payload["reply"] = {"in_reply_to_tweet_id": in_reply_to_tweet_id}
     try:
-        response = requests.post(url, headers=headers, json=payload)
+        response = _http.post(url, headers=headers, json=payload)
     except Exception as e:
         logger.error("Error sending tweet request: %s", e)
         raise XApiError("Failed to send tweet request") from e
@@ -93,7 +102,7 @@ def get_mentions(since_id: Optional[str] = None) -> dict[str, Any]:
     user_me_url = "https://api.twitter.com/2/users/me"
     headers = {"Authorization": f"Bearer {access_token}"}
     try:
-        user_resp = requests.get(user_me_url, headers=headers)
+        user_resp = _http.get(user_me_url, headers=headers)
     except Exception as e:
         logger.error("Error fetching authenticated user info: %s", e)
         raise XApiError("Failed to fetch authenticated user information") from e
@@ -127,7 +136,7 @@ def get_mentions(since_id: Optional[str] = None) -> dict[str, Any]:
         params["since_id"] = since_id
 
     try:
-        resp = requests.get(mentions_url, headers=headers, params=params)
+        resp = _http.get(mentions_url, headers=headers, params=params)
     except Exception as e:
         logger.error("Error fetching mentions: %s", e)
         raise XApiError("Failed to fetch mentions") from e
@@ -187,7 +196,7 @@ def get_profile_metrics() -> dict[str, Any]:
     params = {"user.fields": "username,name,public_metrics"}
 
     try:
-        resp = requests.get(url, headers=headers, params=params)
+        resp = _http.get(url, headers=headers, params=params)
     except Exception as e:
         logger.error("Error fetching profile metrics: %s", e)
         raise XApiError("Failed to fetch profile metrics") from e